@@ -3,6 +3,11 @@ CS Topics Definition for Daily-Bot
 Contains all available topics organized by category
 """
 
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import NamedTuple
+
 # Category definitions with Korean and English names
 CATEGORIES: dict[str, dict[str, str]] = {
     "network": {"ko": "네트워크", "en": "Network"},
@@ -291,13 +296,43 @@ TOPICS: dict[str, list[str]] = {
 }
 
 
-def get_all_topics() -> list[tuple[str, str]]:
-    """Get all topics with their categories"""
-    result = []
-    for category, topics in TOPICS.items():
-        for topic in topics:
-            result.append((category, topic))
-    return result
+class TopicEntry(NamedTuple):
+    """A topic together with its category key"""
+
+    category: str
+    topic: str
+
+
+# Derived tables, built once at import. TOPICS order is kept throughout so the
+# first matching category still wins in infer_category_from_topic.
+CATEGORY_KEYS: frozenset[str] = frozenset(CATEGORIES)
+TOPIC_KEYS: frozenset[str] = frozenset(TOPICS)
+_ALL_TOPICS: tuple[TopicEntry, ...] = tuple(
+    TopicEntry(category, topic) for category, topics in TOPICS.items() for topic in topics
+)
+_TOTAL_TOPIC_COUNT = len(_ALL_TOPICS)
+_CATEGORY_NAMES: dict[tuple[str, str], str] = {
+    (category, lang): name for category, names in CATEGORIES.items() for lang, name in names.items()
+}
+_FOLDED_TOPICS: tuple[tuple[str, str], ...] = tuple(
+    (category, topic.casefold()) for category, topic in _ALL_TOPICS
+)
+# Reversed so that for duplicate topics the earliest category overwrites later ones
+_EXACT_TOPIC_INDEX: dict[str, str] = {
+    topic: category for category, topic in reversed(_FOLDED_TOPICS)
+}
+# All case-folded topics in one NUL-separated haystack, so "query in topic" is a single
+# str.find; _TOPIC_OFFSETS maps a hit position back to its topic index
+_TOPIC_SEP = "\0"
+_JOINED_TOPICS = _TOPIC_SEP.join(topic for _, topic in _FOLDED_TOPICS)
+_TOPIC_OFFSETS: list[int] = list(
+    accumulate((len(topic) + len(_TOPIC_SEP) for _, topic in _FOLDED_TOPICS[:-1]), initial=0)
+)
+
+
+def get_all_topics() -> tuple[TopicEntry, ...]:
+    """Get all topics with their categories (precomputed, immutable)"""
+    return _ALL_TOPICS
 
 
 def get_topics_by_category(category: str) -> list[str]:
@@ -307,17 +342,18 @@ def get_topics_by_category(category: str) -> list[str]:
 
 def get_category_name(category: str, lang: str = "ko") -> str:
     """Get category display name"""
-    return CATEGORIES.get(category, {}).get(lang, category)
+    return _CATEGORY_NAMES.get((category, lang), category)
 
 
 def get_total_topic_count() -> int:
     """Get total number of topics"""
-    return sum(len(topics) for topics in TOPICS.values())
+    return _TOTAL_TOPIC_COUNT
 
 
+@lru_cache(maxsize=4096)
 def infer_category_from_topic(topic: str) -> str | None:
     """
-    Infer category from topic by matching against known topics
+    Infer category from topic by matching against known topics (memoized)
 
     Args:
         topic: The topic string to match
@@ -325,18 +361,25 @@ def infer_category_from_topic(topic: str) -> str | None:
     Returns:
         Category string if found, None otherwise
     """
-    topic_lower = topic.lower().strip()
+    topic_folded = topic.strip().casefold()
 
     # Exact match first
-    for category, topics in TOPICS.items():
-        for known_topic in topics:
-            if known_topic.lower() == topic_lower:
-                return category
+    category = _EXACT_TOPIC_INDEX.get(topic_folded)
+    if category is not None:
+        return category
+
+    # Partial match fallback: the earliest topic that contains the query or is
+    # contained in it. The query-in-topic side is one scan of the joined haystack.
+    first = len(_FOLDED_TOPICS)
+    if _TOPIC_SEP not in topic_folded:
+        pos = _JOINED_TOPICS.find(topic_folded)
+        if pos != -1:
+            first = bisect_right(_TOPIC_OFFSETS, pos) - 1
 
-    # Partial match fallback
-    for category, topics in TOPICS.items():
-        for known_topic in topics:
-            if topic_lower in known_topic.lower() or known_topic.lower() in topic_lower:
-                return category
+    # Only topics before that hit can still win through the topic-in-query side
+    for index in range(first):
+        if _FOLDED_TOPICS[index][1] in topic_folded:
+            first = index
+            break
 
-    return None
+    return _FOLDED_TOPICS[first][0] if first < len(_FOLDED_TOPICS) else None
@@ -5,6 +5,7 @@ Coordinates all components and manages the bot lifecycle
 
 import time
 from datetime import datetime
+from datetime import time as dt_time
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -34,7 +35,7 @@ from src.reports import ReportGenerator
 from src.storage.base import ContentRepository
 from src.utils.async_utils import create_background_task
 from src.utils.datetime_utils import (
-    get_next_run_time,
+    get_next_run_time_from_time,
     now,
     parse_time,
 )
@@ -97,6 +98,7 @@ class CoreEngine:
         self._is_running = False
         self._is_paused = False
         self._start_time: datetime | None = None
+        self._schedule_times: dict[int | None, dt_time] = {}
 
         # Register command handlers
         if self.command_handler:
@@ -172,6 +174,7 @@ class CoreEngine:
     def _add_schedule_job(self, schedule: Schedule) -> None:
         """Add a schedule job to the scheduler"""
         time_obj = parse_time(schedule.time)
+        self._schedule_times[schedule.id] = time_obj
 
         job_id = f"content_generation_{schedule.id}"
 
@@ -226,6 +229,13 @@ class CoreEngine:
 
         logger.info("Report schedules configured")
 
+    def _get_schedule_time(self, schedule: Schedule) -> dt_time:
+        """Get parsed schedule time, reusing the value parsed when the job was added"""
+        time_obj = self._schedule_times.get(schedule.id)
+        if time_obj is None:
+            time_obj = parse_time(schedule.time)
+        return time_obj
+
     async def _execute_content_generation(
         self,
         schedule_id: int | None = None,
@@ -456,6 +466,7 @@ class CoreEngine:
         job_id = f"content_generation_{schedule.id}"
         if self.scheduler.get_job(job_id):
             self.scheduler.remove_job(job_id)
+        self._schedule_times.pop(schedule.id, None)
 
         # Delete schedule
         await self.repository.delete_schedule(schedule.id)
@@ -474,8 +485,9 @@ class CoreEngine:
             return "📋 등록된 스케줄이 없습니다."
 
         lines = ["📋 *등록된 스케줄:*"]
+        current = now()
         for schedule in schedules:
-            next_run = get_next_run_time(schedule.time)
+            next_run = get_next_run_time_from_time(self._get_schedule_time(schedule), current)
             lines.append(f"• `{schedule.time}` (다음 실행: {next_run.strftime('%m/%d %H:%M')})")
 
         return "\n".join(lines)
@@ -560,8 +572,9 @@ class CoreEngine:
 
         # Get next execution time
         next_execution = None
+        current = now()
         for schedule in schedules:
-            next_run = get_next_run_time(schedule.time)
+            next_run = get_next_run_time_from_time(self._get_schedule_time(schedule), current)
             if next_execution is None or next_run < next_execution:
                 next_execution = next_run
 
@@ -573,7 +586,7 @@ class CoreEngine:
         # Calculate uptime
         uptime = 0
         if self._start_time:
-            uptime = int((now() - self._start_time).total_seconds())
+            uptime = int((current - self._start_time).total_seconds())
 
         return BotStatus(
             is_running=self._is_running,
@@ -3,13 +3,18 @@ Error handling and retry logic for Daily-Bot
 """
 
 import asyncio
+import random
+import re
 from collections.abc import Awaitable, Callable
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
 from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
     retry,
     retry_if_exception_type,
+    retry_if_not_exception_type,
     stop_after_attempt,
     wait_exponential,
 )
@@ -17,11 +22,36 @@ from tenacity import (
 from config.settings import settings
 from src.domain.enums import ExecutionStatus
 from src.domain.models import ExecutionLog
-from src.utils.datetime_utils import get_retry_time
+from src.utils.datetime_utils import now
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Backoff grows as base * 2^(attempt-1) until it reaches base * _BACKOFF_CAP_FACTOR
+_BACKOFF_CAP_FACTOR = 32
+
+# Transient error indicators for is_retryable_error, matched in a single pass
+_RETRY_RE = re.compile(
+    "|".join(
+        re.escape(indicator)
+        for indicator in (
+            "timeout",
+            "connection refused",
+            "connection reset",
+            "rate limit",
+            "too many requests",
+            "service unavailable",
+            "bad gateway",
+            "internal server error",
+            "temporarily unavailable",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# Rate-limit markers for _extract_retry_after
+_RATE_LIMIT_RE = re.compile(r"429|rate[_ -]?limit", re.IGNORECASE)
+
 
 class RetryableError(Exception):
     """Error that can be retried"""
@@ -39,12 +69,13 @@ class ErrorHandler:
     """
     Handles errors and retry logic for Daily-Bot
 
-    Implements progressive retry intervals:
-    - Attempt 1: 5 minutes
-    - Attempt 2: 10 minutes
-    - Attempt 3: 15 minutes
-    - Attempt 4: 20 minutes
-    - Attempt 5: 25 minutes (final)
+    Implements exponential backoff with jitter (base_interval=5):
+    - Attempt 1: 2.5-5 minutes
+    - Attempt 2: 5-10 minutes
+    - Attempt 3: 10-20 minutes
+    - Attempt 4: 20-40 minutes
+    - Attempt 5: 40-80 minutes
+    - Attempt 6+: 80-160 minutes (capped at base_interval * 32)
     """
 
     def __init__(
@@ -65,14 +96,27 @@ class ErrorHandler:
         self.base_interval = base_interval or settings.retry_base_interval
         self.on_error_callback = on_error_callback
 
+    def _backoff_seconds(self, attempt: int) -> float:
+        """
+        Calculate the jittered exponential wait after a failed attempt
+
+        Args:
+            attempt: Failed attempt number (1-based)
+
+        Returns:
+            Wait in seconds, drawn from [wait / 2, wait]
+        """
+        base = self.base_interval * 60
+        wait = min(base * _BACKOFF_CAP_FACTOR, base * (1 << (attempt - 1)))
+        return random.uniform(wait * 0.5, wait)
+
     def _extract_retry_after(self, error: Exception) -> int | None:
         """Extract Retry-After value from API errors"""
         if hasattr(error, "response") and hasattr(error.response, "headers"):
             retry_after = error.response.headers.get("Retry-After")
             if retry_after:
                 return int(retry_after)
-        error_str = str(error).lower()
-        if "429" in error_str or "rate_limit" in error_str:
+        if _RATE_LIMIT_RE.search(str(error)):
             return 30
         return None
 
@@ -123,12 +167,29 @@ class ErrorHandler:
             Exception: If all retries fail
         """
         attempt = 0
-        last_error = None
+        last_error: Exception | None = None
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.max_retries),
+            wait=lambda state: self._backoff_seconds(state.attempt_number),
+            retry=retry_if_not_exception_type(NonRetryableError),
+            before_sleep=self._log_before_sleep,
+            sleep=asyncio.sleep,
+            reraise=True,
+        )
+
+        attempts = aiter(retrying)
+        while True:
+            try:
+                retry_attempt = await anext(attempts)
+            except Exception as e:
+                # Retries exhausted or a non-retryable error was raised
+                last_error = e
+                break
 
-        while attempt < self.max_retries:
-            attempt += 1
+            attempt = retry_attempt.retry_state.attempt_number
 
-            # Update execution log
+            # Update execution log; kept outside the retried block so a failure
+            # here propagates instead of counting as a failed attempt
             if execution_log:
                 execution_log.attempt_count = attempt
                 execution_log.status = (
@@ -137,14 +198,35 @@ class ErrorHandler:
                 if update_log_callback:
                     await update_log_callback(execution_log)
 
-            try:
+            with retry_attempt:
                 logger.info(
                     "Executing with retry",
                     attempt=attempt,
                     max_retries=self.max_retries,
                 )
 
-                result = await func(*args, **kwargs)
+                try:
+                    result = await func(*args, **kwargs)
+                except NonRetryableError as e:
+                    # Don't retry
+                    logger.error(
+                        "Non-retryable error occurred",
+                        error=str(e),
+                        attempt=attempt,
+                    )
+                    raise
+                except Exception as e:
+                    logger.warning(
+                        "Attempt failed",
+                        error=str(e),
+                        attempt=attempt,
+                        max_retries=self.max_retries,
+                    )
+                    if execution_log:
+                        execution_log.error_message = str(e)
+                        if update_log_callback:
+                            await update_log_callback(execution_log)
+                    raise
 
                 # Success
                 if execution_log:
@@ -155,40 +237,6 @@ class ErrorHandler:
 
                 return result
 
-            except NonRetryableError as e:
-                # Don't retry
-                logger.error(
-                    "Non-retryable error occurred",
-                    error=str(e),
-                    attempt=attempt,
-                )
-                last_error = e
-                break
-
-            except Exception as e:
-                last_error = e
-                logger.warning(
-                    "Attempt failed",
-                    error=str(e),
-                    attempt=attempt,
-                    max_retries=self.max_retries,
-                )
-
-                if execution_log:
-                    execution_log.error_message = str(e)
-                    if update_log_callback:
-                        await update_log_callback(execution_log)
-
-                if attempt < self.max_retries:
-                    # Calculate wait time
-                    wait_seconds = self.base_interval * attempt * 60
-                    logger.info(
-                        "Waiting before retry",
-                        wait_seconds=wait_seconds,
-                        next_attempt=attempt + 1,
-                    )
-                    await asyncio.sleep(wait_seconds)
-
         # All retries exhausted
         if execution_log:
             execution_log.status = ExecutionStatus.FAILED
@@ -210,6 +258,15 @@ class ErrorHandler:
 
         raise last_error if last_error else Exception("All retries failed")
 
+    @staticmethod
+    def _log_before_sleep(retry_state: RetryCallState) -> None:
+        """Log the wait chosen by the backoff before the next attempt"""
+        logger.info(
+            "Waiting before retry",
+            wait_seconds=retry_state.next_action.sleep if retry_state.next_action else None,
+            next_attempt=retry_state.attempt_number + 1,
+        )
+
     def calculate_next_retry_time(self, attempt: int) -> datetime:
         """
         Calculate the next retry time
@@ -220,7 +277,7 @@ class ErrorHandler:
         Returns:
             Datetime for next retry
         """
-        return get_retry_time(attempt, self.base_interval)
+        return now() + timedelta(seconds=self._backoff_seconds(attempt))
 
     def should_retry(self, attempt: int, error: Exception) -> bool:
         """
@@ -273,17 +330,4 @@ def is_retryable_error(error: Exception) -> bool:
         return True
 
     # Check for common transient errors
-    error_str = str(error).lower()
-    retryable_indicators = [
-        "timeout",
-        "connection refused",
-        "connection reset",
-        "rate limit",
-        "too many requests",
-        "service unavailable",
-        "bad gateway",
-        "internal server error",
-        "temporarily unavailable",
-    ]
-
-    return any(indicator in error_str for indicator in retryable_indicators)
+    return _RETRY_RE.search(str(error)) is not None
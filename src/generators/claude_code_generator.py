@@ -6,6 +6,7 @@ import asyncio
 import json
 import random
 import re
+import sys
 
 from config.topics import TOPICS, get_category_name
 from src.domain.enums import Category, Difficulty
@@ -16,6 +17,94 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_CODE_BLOCK_RE = re.compile(r"```json\s*([\s\S]*?)\s*```")
+# Characters that matter when scanning for a balanced JSON object
+_JSON_TOKEN_RE = re.compile(r'[{}"\\]')
+# A '{' can only open a JSON object when followed by a key or by '}'
+_OBJECT_START_RE = re.compile(r"\{\s*[\"}]")
+_DECODER = json.JSONDecoder()
+
+
+def _record_object_spans(text: str, start: int, spans: dict[int, tuple[int, int]]) -> None:
+    """
+    Record where every '{' opened outside a string closes, scanning from start
+
+    One pass over the span that starts at start. Every '{' met outside a string
+    scans identically from its own position, so its span is recorded too and
+    later candidates inside the span are never rescanned.
+
+    Args:
+        text: Text being scanned
+        start: Index of the opening '{'
+        spans: Maps an opening index to (closing index, nesting depth), with a
+            closing index of -1 if it never closes
+    """
+    # [opening index, deepest nesting seen inside it]
+    stack: list[list[int]] = []
+    in_string = False
+    escaped_pos = -1
+
+    for match in _JSON_TOKEN_RE.finditer(text, start):
+        pos = match.start()
+        if pos == escaped_pos:
+            continue
+        char = match.group()
+
+        if in_string:
+            if char == "\\":
+                escaped_pos = pos + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            stack.append([pos, 1])
+        elif char == "}":
+            opened, depth = stack.pop()
+            spans[opened] = (pos, depth)
+            if not stack:
+                return
+            if depth >= stack[-1][1]:
+                stack[-1][1] = depth + 1
+
+    for opened, depth in stack:
+        spans[opened] = (-1, depth)
+
+
+def _find_json_object(text: str) -> dict | None:
+    """
+    Find the first JSON object embedded in text
+
+    Every '{' is a candidate, in order, so a stray brace or a non-JSON outer
+    span does not hide an object nested after it. Brace matching is shared
+    between candidates, keeping the scan linear, and only candidates that
+    look like an object, close, and nest shallowly enough to decode are tried.
+
+    Args:
+        text: Text possibly containing a JSON object
+
+    Returns:
+        Parsed object, or None if no candidate parses
+    """
+    spans: dict[int, tuple[int, int]] = {}
+    max_depth = sys.getrecursionlimit()
+
+    for match in _OBJECT_START_RE.finditer(text):
+        start = match.start()
+        if start not in spans:
+            _record_object_spans(text, start, spans)
+        end, depth = spans[start]
+        if end == -1 or depth >= max_depth:
+            continue
+        try:
+            data, _ = _DECODER.raw_decode(text, start)
+        except (json.JSONDecodeError, RecursionError):
+            continue
+        if isinstance(data, dict):
+            return data
+
+    return None
+
 
 class ClaudeCodeGenerator(ContentGenerator):
     """
@@ -244,19 +333,12 @@ class ClaudeCodeGenerator(ContentGenerator):
         """
         try:
             # Try to extract JSON from response
-            json_match = re.search(r"```json\s*([\s\S]*?)\s*```", response)
+            json_match = _CODE_BLOCK_RE.search(response)
             if json_match:
                 data = json.loads(json_match.group(1))
             else:
-                # Try each '{' position with raw_decode (tolerates trailing text)
-                decoder = json.JSONDecoder()
-                data = None
-                for m in re.finditer(r"\{", response):
-                    try:
-                        data, _ = decoder.raw_decode(response, m.start())
-                        break
-                    except json.JSONDecodeError:
-                        continue
+                # Scan for the first object (tolerates surrounding text)
+                data = _find_json_object(response)
                 if data is None:
                     raise GenerationError("No JSON found in response")
 
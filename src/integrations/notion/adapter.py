@@ -21,6 +21,10 @@ from src.utils.rate_limiter import AsyncRateLimiter
 
 logger = get_logger(__name__)
 
+# Markdown line patterns used by _markdown_to_blocks
+_NUMBERED_ITEM_RE = re.compile(r"(\d+)\.\s+(.*)")
+_DIVIDERS = frozenset({"---", "***", "___"})
+
 
 class NotionAdapter:
     """
@@ -30,8 +34,8 @@ class NotionAdapter:
     Pages are created under data_source_id instead of database_id.
     """
 
-    def __init__(self, api_key: str | None = None):
-        self.client = AsyncClient(auth=api_key or settings.notion_api_key)
+    def __init__(self, api_key: str | None = None, client: AsyncClient | None = None):
+        self.client = client or AsyncClient(auth=api_key or settings.notion_api_key)
         self.database_id = settings.notion_database_id
         self._data_source_id: str | None = None
         self._schema_initialized = False
@@ -476,7 +480,7 @@ class NotionAdapter:
                     }
                 )
             # Numbered list
-            elif num_match := re.match(r"^(\d+)\.\s+(.*)", line):
+            elif num_match := _NUMBERED_ITEM_RE.match(line):
                 blocks.append(
                     {
                         "type": "numbered_list_item",
@@ -494,7 +498,7 @@ class NotionAdapter:
                     }
                 )
             # Divider
-            elif line.strip() in ["---", "***", "___"]:
+            elif line.strip() in _DIVIDERS:
                 blocks.append({"type": "divider", "divider": {}})
             # Empty line
             elif not line.strip():
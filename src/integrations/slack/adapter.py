@@ -88,50 +88,7 @@ class SlackAdapter:
             Message timestamp if successful
         """
         target_channel = channel or settings.slack_channel_id
-
-        # Get category display name
-        category_name = get_category_name(
-            content.category.value if isinstance(content.category, Category) else content.category,
-            settings.language,
-        )
-
-        # Build blocks for rich formatting
-        blocks = [
-            {
-                "type": "header",
-                "text": {"type": "plain_text", "text": f"📚 {content.title}", "emoji": True},
-            },
-            {
-                "type": "section",
-                "fields": [
-                    {"type": "mrkdwn", "text": f"*카테고리:* {category_name}"},
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*난이도:* {content.difficulty.korean if hasattr(content.difficulty, 'korean') else content.difficulty}",
-                    },
-                ],
-            },
-            {"type": "section", "text": {"type": "mrkdwn", "text": content.summary}},
-        ]
-
-        # Add Notion link if available
-        if content.notion_url:
-            blocks.append(
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": f"📖 <{content.notion_url}|자세히 보기>"},
-                }
-            )
-
-        # Add tags
-        if content.tags:
-            tags_text = " ".join([f"`{tag}`" for tag in content.tags])
-            blocks.append(
-                {"type": "context", "elements": [{"type": "mrkdwn", "text": f"🏷️ {tags_text}"}]}
-            )
-
-        # Add divider
-        blocks.append({"type": "divider"})
+        blocks = self._build_content_blocks(content)
 
         message = SlackMessage(
             channel=target_channel,
@@ -314,7 +271,69 @@ class SlackAdapter:
             Message timestamp if successful
         """
         target_channel = channel or settings.report_channel
+        report_type = "주간" if report.report_type == "weekly" else "월간"
+        blocks = self._build_report_blocks(report, notion_url)
+
+        message = SlackMessage(
+            channel=target_channel,
+            text=f"📈 Daily-Bot {report_type} 리포트가 생성되었습니다.",
+            blocks=blocks,
+        )
+
+        return await self.send_message(message)
 
+    def _build_content_blocks(self, content: ContentRecord) -> list[dict[str, Any]]:
+        """Build Slack blocks for a content notification"""
+        # Get category display name
+        category_name = get_category_name(
+            content.category.value if isinstance(content.category, Category) else content.category,
+            settings.language,
+        )
+
+        # Build blocks for rich formatting
+        blocks = [
+            {
+                "type": "header",
+                "text": {"type": "plain_text", "text": f"📚 {content.title}", "emoji": True},
+            },
+            {
+                "type": "section",
+                "fields": [
+                    {"type": "mrkdwn", "text": f"*카테고리:* {category_name}"},
+                    {
+                        "type": "mrkdwn",
+                        "text": f"*난이도:* {content.difficulty.korean if hasattr(content.difficulty, 'korean') else content.difficulty}",
+                    },
+                ],
+            },
+            {"type": "section", "text": {"type": "mrkdwn", "text": content.summary}},
+        ]
+
+        # Add Notion link if available
+        if content.notion_url:
+            blocks.append(
+                {
+                    "type": "section",
+                    "text": {"type": "mrkdwn", "text": f"📖 <{content.notion_url}|자세히 보기>"},
+                }
+            )
+
+        # Add tags
+        if content.tags:
+            tags_text = " ".join([f"`{tag}`" for tag in content.tags])
+            blocks.append(
+                {"type": "context", "elements": [{"type": "mrkdwn", "text": f"🏷️ {tags_text}"}]}
+            )
+
+        # Add divider
+        blocks.append({"type": "divider"})
+
+        return blocks
+
+    def _build_report_blocks(
+        self, report: ReportData, notion_url: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Build Slack blocks for a report notification"""
         report_type = "주간" if report.report_type == "weekly" else "월간"
 
         blocks = [
@@ -382,13 +401,7 @@ class SlackAdapter:
                 }
             )
 
-        message = SlackMessage(
-            channel=target_channel,
-            text=f"📈 Daily-Bot {report_type} 리포트가 생성되었습니다.",
-            blocks=blocks,
-        )
-
-        return await self.send_message(message)
+        return blocks
 
     async def send_help(self, channel: str) -> str | None:
         """
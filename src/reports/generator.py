@@ -5,7 +5,7 @@ Generates weekly and monthly reports
 
 from datetime import datetime
 
-from config.topics import CATEGORIES
+from config.topics import CATEGORY_KEYS
 from src.domain.enums import ExecutionStatus, ReportType
 from src.domain.models import ReportData
 from src.integrations.notion import NotionAdapter
@@ -185,9 +185,7 @@ class ReportGenerator:
         )
 
         # Find uncovered categories
-        all_categories = set(CATEGORIES.keys())
-        covered_categories = set(category_distribution.keys())
-        uncovered_categories = list(all_categories - covered_categories)
+        uncovered_categories = list(CATEGORY_KEYS - category_distribution.keys())
 
         return ReportData(
             report_type=report_type,
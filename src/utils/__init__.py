@@ -9,7 +9,7 @@ from src.utils.datetime_utils import (
     get_last_week_range,
     get_month_range,
     get_next_run_time,
-    get_retry_time,
+    get_next_run_time_from_time,
     get_timezone,
     get_week_range,
     humanize_timedelta,
@@ -24,6 +24,7 @@ from src.utils.logger import (
     cleanup_old_logs,
     get_logger,
     setup_logging,
+    today_yyyymmdd,
 )
 
 __all__ = [
@@ -32,6 +33,7 @@ __all__ = [
     "get_logger",
     "cleanup_old_logs",
     "LogContext",
+    "today_yyyymmdd",
     # DateTime
     "get_timezone",
     "now",
@@ -40,12 +42,12 @@ __all__ = [
     "format_time",
     "format_datetime",
     "get_next_run_time",
+    "get_next_run_time_from_time",
     "get_week_range",
     "get_last_week_range",
     "get_month_range",
     "get_last_month_range",
     "is_weekday",
     "is_month_day",
-    "get_retry_time",
     "humanize_timedelta",
 ]
@@ -56,7 +56,7 @@ def format_time(t: time) -> str:
     Returns:
         Formatted time string
     """
-    return t.strftime("%H:%M")
+    return f"{t.hour:02d}:{t.minute:02d}"
 
 
 def format_datetime(dt: datetime, include_time: bool = True) -> str:
@@ -70,24 +70,39 @@ def format_datetime(dt: datetime, include_time: bool = True) -> str:
     Returns:
         Formatted datetime string
     """
+    date_str = f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
     if include_time:
-        return dt.strftime("%Y-%m-%d %H:%M")
-    return dt.strftime("%Y-%m-%d")
+        return f"{date_str} {dt.hour:02d}:{dt.minute:02d}"
+    return date_str
 
 
-def get_next_run_time(schedule_time: str) -> datetime:
+def get_next_run_time(schedule_time: str, reference_date: datetime | None = None) -> datetime:
     """
     Calculate next run time for a schedule
 
     Args:
         schedule_time: Schedule time in HH:MM format
+        reference_date: Reference date (defaults to now); pass a shared value
+            when evaluating several schedules in one pass
 
     Returns:
         Next run datetime
     """
-    t = parse_time(schedule_time)
-    get_timezone()
-    current = now()
+    return get_next_run_time_from_time(parse_time(schedule_time), reference_date)
+
+
+def get_next_run_time_from_time(t: time, reference_date: datetime | None = None) -> datetime:
+    """
+    Calculate next run time from an already parsed schedule time
+
+    Args:
+        t: Schedule time
+        reference_date: Reference date (defaults to now)
+
+    Returns:
+        Next run datetime
+    """
+    current = reference_date or now()
 
     next_run = current.replace(
         hour=t.hour,
@@ -206,22 +221,6 @@ def is_month_day(day: int, reference_date: datetime | None = None) -> bool:
     return ref.day == day
 
 
-def get_retry_time(attempt: int, base_interval: int = 5) -> datetime:
-    """
-    Calculate next retry time based on attempt number
-    Progressive intervals: 5, 10, 15, 20, 25 minutes
-
-    Args:
-        attempt: Current attempt number (1-based)
-        base_interval: Base interval in minutes
-
-    Returns:
-        Next retry datetime
-    """
-    interval_minutes = base_interval * attempt
-    return now() + timedelta(minutes=interval_minutes)
-
-
 def humanize_timedelta(td: timedelta) -> str:
     """
     Convert timedelta to human-readable string
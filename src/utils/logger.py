@@ -5,7 +5,8 @@ Using structlog for structured logging
 
 import logging
 import sys
-from datetime import datetime
+import time
+from datetime import date
 from pathlib import Path
 
 import structlog
@@ -13,6 +14,26 @@ from structlog.typing import Processor
 
 from config.settings import settings
 
+# Default log directory, shared by setup_logging and cleanup_old_logs
+_LOG_DIR = Path(__file__).parent.parent.parent / "logs"
+_CONFIGURED: bool = False
+_TODAY_CACHE: tuple[date, str] | None = None
+
+
+def today_yyyymmdd() -> str:
+    """
+    Get today's local date as YYYYMMDD, recomputed only when the date changes
+
+    Returns:
+        Date string used in daily log filenames
+    """
+    global _TODAY_CACHE
+
+    current = date.today()
+    if _TODAY_CACHE is None or _TODAY_CACHE[0] != current:
+        _TODAY_CACHE = (current, f"{current.year:04d}{current.month:02d}{current.day:02d}")
+    return _TODAY_CACHE[1]
+
 
 def setup_logging(
     log_level: str | None = None,
@@ -21,20 +42,28 @@ def setup_logging(
     """
     Setup structured logging for the application
 
+    Repeated calls without overrides are no-ops; passing an override
+    replaces the handlers installed by the previous call.
+
     Args:
         log_level: Override log level from settings
         log_dir: Override log directory
     """
+    global _CONFIGURED
+
+    if _CONFIGURED and log_level is None and log_dir is None:
+        return
+
     level = getattr(logging, (log_level or settings.log_level).upper())
 
     # Create log directory
-    log_path = Path(log_dir) if log_dir else Path(__file__).parent.parent.parent / "logs"
+    log_path = Path(log_dir) if log_dir else _LOG_DIR
     log_path.mkdir(parents=True, exist_ok=True)
 
     # Log file with date
-    log_file = log_path / f"daily_bot_{datetime.now().strftime('%Y%m%d')}.log"
+    log_file = log_path / f"daily_bot_{today_yyyymmdd()}.log"
 
-    # Configure standard logging
+    # Configure standard logging (force closes handlers from a previous call)
     logging.basicConfig(
         format="%(message)s",
         level=level,
@@ -42,6 +71,7 @@ def setup_logging(
             logging.StreamHandler(sys.stdout),
             logging.FileHandler(log_file, encoding="utf-8"),
         ],
+        force=_CONFIGURED,
     )
 
     # Shared processors
@@ -65,6 +95,8 @@ def setup_logging(
         cache_logger_on_first_use=True,
     )
 
+    _CONFIGURED = True
+
 
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """
@@ -90,13 +122,13 @@ def cleanup_old_logs(retention_days: int | None = None) -> int:
         Number of files deleted
     """
     days = retention_days or settings.log_retention_days
-    log_path = Path(__file__).parent.parent.parent / "logs"
+    log_path = _LOG_DIR
 
     if not log_path.exists():
         return 0
 
     deleted_count = 0
-    cutoff_date = datetime.now().timestamp() - (days * 24 * 60 * 60)
+    cutoff_date = time.time() - days * 86400
 
     for log_file in log_path.glob("daily_bot_*.log"):
         if log_file.stat().st_mtime < cutoff_date:
@@ -2,40 +2,64 @@
 
 import asyncio
 import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 
 class AsyncRateLimiter:
     """Token bucket rate limiter"""
 
-    def __init__(self, rate: float, period: float = 1.0, burst: int = 1):
+    def __init__(
+        self,
+        rate: float,
+        period: float = 1.0,
+        burst: int = 1,
+        single_producer: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
         """
         Args:
             rate: Number of allowed requests per period
             period: Period duration in seconds
             burst: Maximum burst size
+            single_producer: Skip locking; only safe when a single task calls acquire
+            clock: Monotonic time source in seconds
+            sleep: Coroutine used to wait for a token
         """
         self._rate = rate
         self._period = period
         self._burst = burst
+        self._clock = clock
+        self._sleep = sleep
         self._tokens = float(burst)
-        self._last_refill = time.monotonic()
-        self._lock = asyncio.Lock()
+        self._last_refill = clock()
+        self._lock: asyncio.Lock | None = None if single_producer else asyncio.Lock()
 
     async def acquire(self) -> None:
         """Acquire a token, waiting if necessary"""
+        if self._lock is None:
+            await self._acquire()
+            return
+
         async with self._lock:
-            now = time.monotonic()
-            elapsed = now - self._last_refill
-            self._tokens = min(self._burst, self._tokens + elapsed * self._rate / self._period)
-            self._last_refill = now
-
-            if self._tokens < 1.0:
-                wait_time = (1.0 - self._tokens) * self._period / self._rate
-                await asyncio.sleep(wait_time)
-                self._tokens = 0.0
-            else:
-                self._tokens -= 1.0
+            await self._acquire()
+
+    async def _acquire(self) -> None:
+        """Refill and take a token; caller guarantees exclusive access"""
+        now = self._clock()
+        elapsed = now - self._last_refill
+        self._tokens = min(self._burst, self._tokens + elapsed * self._rate / self._period)
+        self._last_refill = now
+
+        if self._tokens < 1.0:
+            wait_time = (1.0 - self._tokens) * self._period / self._rate
+            await self._sleep(wait_time)
+            # The token accrued while sleeping is ours; start the next refill from now
+            self._tokens = 0.0
+            self._last_refill = self._clock()
+        else:
+            self._tokens -= 1.0
 
     async def __aenter__(self) -> "AsyncRateLimiter":
         await self.acquire()
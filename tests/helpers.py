@@ -0,0 +1,148 @@
+"""
+Test doubles shared by Daily-Bot test modules
+"""
+
+from unittest.mock import AsyncMock
+
+from src.domain.enums import (
+    Category,
+    ContentStatus,
+    Difficulty,
+    ExecutionStatus,
+    ScheduleStatus,
+)
+from src.domain.models import ContentRecord, ExecutionLog, Schedule
+
+
+class StubRepository:
+    """
+    ContentRepository test double
+
+    Methods whose calls no test inspects are plain coroutines returning the
+    ``*_return`` attributes; set those to reconfigure a result. Only methods
+    that tests check with ``assert_awaited*`` or ``call_args`` stay AsyncMock.
+    """
+
+    def __init__(self):
+        self.get_content_return: ContentRecord | None = None
+        self.get_used_topics_return: list[str] = []
+        self.list_execution_logs_return: list = []
+        self.get_schedule_by_time_return: Schedule | None = None
+        self.get_content_count_return = 0
+        self.get_execution_stats_return: dict = {
+            "success": {
+                "count": 9,
+                "total_attempts": 10,
+                "avg_duration_ms": 10500,
+                "min_duration_ms": 8000,
+                "max_duration_ms": 15000,
+            },
+            "failed": {
+                "count": 1,
+                "total_attempts": 5,
+                "avg_duration_ms": None,
+                "min_duration_ms": None,
+                "max_duration_ms": None,
+            },
+        }
+        self.get_category_distribution_return: dict[str, int] = {"network": 3, "os": 2}
+
+        # Observed by tests
+        self.initialize = AsyncMock()
+        self.close = AsyncMock()
+        self.save_content = AsyncMock(
+            return_value=ContentRecord(
+                id=1,
+                title="Test Topic",
+                category=Category.NETWORK,
+                difficulty=Difficulty.INTERMEDIATE,
+                summary="Test summary",
+                content="Test summary",
+                tags=["tag1"],
+                author="TestUser",
+                status=ContentStatus.DRAFT,
+            )
+        )
+        self.update_content = AsyncMock(
+            return_value=ContentRecord(
+                id=1,
+                title="Test Topic",
+                category=Category.NETWORK,
+                difficulty=Difficulty.INTERMEDIATE,
+                summary="Test summary",
+                content="Test summary",
+                tags=["tag1"],
+                author="TestUser",
+                status=ContentStatus.PUBLISHED,
+            )
+        )
+        self.list_schedules = AsyncMock(return_value=[])
+        self.save_schedule = AsyncMock(
+            return_value=Schedule(id=1, time="07:00", status=ScheduleStatus.ACTIVE)
+        )
+        self.update_schedule = AsyncMock()
+        self.delete_schedule = AsyncMock(return_value=True)
+        # Fresh per stub: the engine mutates the log it gets back
+        self.save_execution_log = AsyncMock(
+            return_value=ExecutionLog(id=1, status=ExecutionStatus.PENDING)
+        )
+        self.update_execution_log = AsyncMock()
+        self.save_topic_request = AsyncMock()
+
+    async def get_content(self, *args, **kwargs):
+        return self.get_content_return
+
+    async def get_used_topics(self, *args, **kwargs):
+        return self.get_used_topics_return
+
+    async def list_execution_logs(self, *args, **kwargs):
+        return self.list_execution_logs_return
+
+    async def mark_request_processed(self, *args, **kwargs):
+        return None
+
+    async def get_schedule_by_time(self, *args, **kwargs):
+        return self.get_schedule_by_time_return
+
+    async def get_content_count(self, *args, **kwargs):
+        return self.get_content_count_return
+
+    async def get_execution_stats(self, *args, **kwargs):
+        return self.get_execution_stats_return
+
+    async def get_category_distribution(self, *args, **kwargs):
+        return self.get_category_distribution_return
+
+
+class CallRecorder:
+    """
+    Lightweight async adapter double
+
+    Every awaited method call is appended to ``calls`` as (name, args, kwargs).
+    ``responses`` maps method names to return values; an exception is raised.
+    """
+
+    def __init__(self, **responses):
+        self.calls: list[tuple[str, tuple, dict]] = []
+        self.responses = responses
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        async def method(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            result = self.responses.get(name)
+            if isinstance(result, BaseException):
+                raise result
+            return result
+
+        return method
+
+    def awaited(self, name: str) -> list[tuple[tuple, dict]]:
+        """(args, kwargs) of every awaited call to name"""
+        return [(args, kwargs) for called, args, kwargs in self.calls if called == name]
+
+    def assert_awaited_once(self, name: str) -> None:
+        count = len(self.awaited(name))
+        assert count == 1, f"{name} awaited {count} times"
@@ -0,0 +1,11 @@
+"""
+Pytest fixtures shared by the integration tests
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _settings_once(module_settings):
+    """Settings are loaded once for the module instead of per test"""
+    return module_settings
@@ -10,12 +10,8 @@ from src.domain.enums import SlackCommandType
 
 
 @pytest.fixture
-def command_handler(mock_settings):
+def command_handler():
     """Create CommandHandler with mocked dependencies"""
-    from config.settings import get_settings
-
-    get_settings.cache_clear()
-
     with patch("src.integrations.slack.command_handler.AsyncApp"):
         from src.integrations.slack.command_handler import CommandHandler
 
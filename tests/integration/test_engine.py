@@ -2,49 +2,123 @@
 Integration tests for src/core/engine.py
 """
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from config.settings import get_settings
+from src.core.engine import CoreEngine
 from src.domain.enums import (
     Category,
     ContentStatus,
     Difficulty,
-    ExecutionStatus,
     ScheduleStatus,
 )
 from src.domain.models import (
     ContentRecord,
-    ExecutionLog,
     Schedule,
     TopicRequest,
 )
 
+_SAMPLE_CONTENT = ContentRecord(
+    id=1,
+    title="T",
+    category=Category.NETWORK,
+    difficulty=Difficulty.INTERMEDIATE,
+    summary="S",
+    content="S",
+    tags=[],
+    author="A",
+    status=ContentStatus.DRAFT,
+)
 
-@pytest.fixture
-def engine(mock_settings, mock_repository, mock_generator, mock_slack_adapter, mock_notion_adapter):
-    """Create CoreEngine with all mocked dependencies"""
-    from config.settings import get_settings
-
-    get_settings.cache_clear()
-
-    with patch("src.core.engine.AsyncIOScheduler") as MockScheduler:
-        scheduler_instance = MagicMock()
-        scheduler_instance.get_job.return_value = None
-        MockScheduler.return_value = scheduler_instance
-
-        from src.core.engine import CoreEngine
-
-        e = CoreEngine(
-            repository=mock_repository,
-            generator=mock_generator,
-            slack_adapter=mock_slack_adapter,
-            notion_adapter=mock_notion_adapter,
-        )
-        e.scheduler = scheduler_instance
+
+@pytest.fixture(scope="module")
+def _engine_template(test_env):
+    """Build one CoreEngine per module; collaborators are swapped in per test"""
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in test_env.items():
+            mp.setenv(key, value)
+        get_settings.cache_clear()
+
+        with patch("src.core.engine.AsyncIOScheduler", return_value=MagicMock()):
+            e = CoreEngine(
+                repository=MagicMock(),
+                generator=MagicMock(),
+                slack_adapter=MagicMock(),
+                notion_adapter=None,
+            )
+        e.scheduler.get_job.return_value = None
         yield e
 
 
+def _optional_fixture(request, name, default):
+    """Materialize a collaborator fixture only if the test itself asks for it"""
+    if name in request.fixturenames:
+        return request.getfixturevalue(name)
+    return default
+
+
+@pytest.fixture
+def engine(request, _engine_template, mock_settings, mock_repository, mock_generator):
+    """
+    CoreEngine template rebound to this test's mocks with state reset
+
+    Parametrize indirectly to override the Notion adapter (e.g. ``[None]``).
+    """
+    # Slack is always awaited, so the stand-in must be awaitable; the engine skips
+    # Notion when it is None
+    mock_slack_adapter = _optional_fixture(request, "mock_slack_adapter", AsyncMock())
+    if hasattr(request, "param"):
+        mock_notion_adapter = request.param
+    else:
+        mock_notion_adapter = _optional_fixture(request, "mock_notion_adapter", None)
+
+    e = _engine_template
+    e.repository = mock_repository
+    e.generator = mock_generator
+    e.slack = mock_slack_adapter
+    e.notion = mock_notion_adapter
+    e.report_generator.repository = mock_repository
+    e.report_generator.slack = mock_slack_adapter
+    e.report_generator.notion = mock_notion_adapter
+
+    # Keeps the template's get_job default; tests that override it must restore it
+    e.scheduler.reset_mock(side_effect=True)
+    e._is_running = False
+    e._is_paused = False
+    e._start_time = None
+    e._schedule_times.clear()
+    return e
+
+
+@pytest.fixture
+def bare_engine():
+    """Pause-state-only stand-in: binds the CoreEngine methods that just use _is_paused"""
+    e = SimpleNamespace(_is_paused=False)
+    e._handle_pause_command = CoreEngine._handle_pause_command.__get__(e)
+    e._handle_resume_command = CoreEngine._handle_resume_command.__get__(e)
+    # Returns before touching any collaborator while paused
+    e._execute_content_generation = CoreEngine._execute_content_generation.__get__(e)
+    return e
+
+
+def _set_result(mock, result):
+    """Make an AsyncMock raise ``result`` if it is an exception, else return it"""
+    if isinstance(result, Exception):
+        mock.side_effect = result
+    else:
+        mock.return_value = result
+
+
+@pytest.fixture
+def mock_retry(engine):
+    """Patch the engine's retry wrapper; configure via return_value/side_effect"""
+    with patch.object(engine.error_handler, "execute_with_retry", new_callable=AsyncMock) as m:
+        yield m
+
+
 class TestLifecycle:
     @pytest.mark.asyncio
     async def test_start_initializes_repository(self, engine, mock_repository):
@@ -82,7 +156,6 @@ class TestLifecycle:
 
 class TestContentGeneration:
     @pytest.mark.asyncio
-    @patch("src.core.engine.ErrorHandler.execute_with_retry")
     async def test_success_flow(
         self,
         mock_retry,
@@ -92,61 +165,28 @@ class TestContentGeneration:
         mock_slack_adapter,
         mock_notion_adapter,
     ):
-        content = ContentRecord(
-            id=1,
-            title="Test",
-            category=Category.NETWORK,
-            difficulty=Difficulty.INTERMEDIATE,
-            summary="Summary",
-            content="Summary",
-            tags=["tag1"],
-            author="TestUser",
-            status=ContentStatus.PUBLISHED,
-        )
-        mock_retry.return_value = content
-        # save_execution_log needs to return an ExecutionLog with id
-        mock_repository.save_execution_log.return_value = ExecutionLog(
-            id=1, status=ExecutionStatus.PENDING
-        )
+        mock_retry.return_value = _SAMPLE_CONTENT
 
         result = await engine._execute_content_generation(schedule_id=1)
         assert result is not None
         mock_retry.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_skips_when_paused(self, engine):
-        engine._is_paused = True
-        result = await engine._execute_content_generation()
+    async def test_skips_when_paused(self, bare_engine):
+        bare_engine._is_paused = True
+        result = await bare_engine._execute_content_generation()
         assert result is None
 
     @pytest.mark.asyncio
-    @patch("src.core.engine.ErrorHandler.execute_with_retry")
     async def test_creates_execution_log(self, mock_retry, engine, mock_repository):
-        mock_retry.return_value = ContentRecord(
-            id=1,
-            title="T",
-            category=Category.NETWORK,
-            difficulty=Difficulty.INTERMEDIATE,
-            summary="S",
-            content="S",
-            tags=[],
-            author="A",
-            status=ContentStatus.DRAFT,
-        )
-        mock_repository.save_execution_log.return_value = ExecutionLog(
-            id=1, status=ExecutionStatus.PENDING
-        )
+        mock_retry.return_value = _SAMPLE_CONTENT
 
         await engine._execute_content_generation()
         mock_repository.save_execution_log.assert_awaited()
 
     @pytest.mark.asyncio
-    @patch("src.core.engine.ErrorHandler.execute_with_retry")
     async def test_handles_generation_failure(self, mock_retry, engine, mock_repository):
         mock_retry.side_effect = Exception("generation failed")
-        mock_repository.save_execution_log.return_value = ExecutionLog(
-            id=1, status=ExecutionStatus.PENDING
-        )
 
         result = await engine._execute_content_generation()
         assert result is None
@@ -184,52 +224,57 @@ class TestContentGeneration:
     @pytest.mark.asyncio
     async def test_with_topic_request(self, engine, mock_generator):
         request = TopicRequest(id=1, topic="TCP handshake", requested_by="U123")
-        content = await engine._generate_and_publish(topic_request=request)
+        await engine._generate_and_publish(topic_request=request)
         mock_generator.generate.assert_awaited_once()
-
-    @pytest.mark.asyncio
-    async def test_both_notion_and_slack_failure_keeps_draft(
-        self, engine, mock_notion_adapter, mock_slack_adapter, mock_repository
-    ):
-        """When both Notion and Slack fail, content should stay DRAFT"""
-        mock_notion_adapter.create_content_page = AsyncMock(side_effect=Exception("Notion fail"))
-        mock_slack_adapter.send_content_notification = AsyncMock(
-            side_effect=Exception("Slack fail")
-        )
-        content = await engine._generate_and_publish()
-        # update_content is called with the content; check the status passed
-        update_call = mock_repository.update_content.call_args[0][0]
-        assert update_call.status == ContentStatus.DRAFT
-
-    @pytest.mark.asyncio
-    async def test_published_when_slack_succeeds_but_notion_fails(
-        self, engine, mock_notion_adapter, mock_slack_adapter, mock_repository
+        engine.slack.send_content_notification.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "notion_result, slack_result, expected",
+        [
+            (Exception("Notion fail"), Exception("Slack fail"), ContentStatus.DRAFT),
+            (Exception("Notion fail"), "ts123", ContentStatus.PUBLISHED),
+            (
+                ("page-id", "https://notion.so/page"),
+                Exception("Slack fail"),
+                ContentStatus.PUBLISHED,
+            ),
+            (None, "ts123", ContentStatus.PUBLISHED),
+            (None, Exception("Slack fail"), ContentStatus.DRAFT),
+        ],
+        ids=[
+            "both-fail-draft",
+            "notion-fails-published",
+            "slack-fails-published",
+            "no-notion-published",
+            "no-notion-slack-fails-draft",
+        ],
+    )
+    async def test_publish_status(
+        self,
+        engine,
+        mock_notion_adapter,
+        mock_slack_adapter,
+        mock_repository,
+        notion_result,
+        slack_result,
+        expected,
     ):
-        """When Notion fails but Slack succeeds, content should be PUBLISHED"""
-        mock_notion_adapter.create_content_page = AsyncMock(side_effect=Exception("Notion fail"))
-        mock_slack_adapter.send_content_notification = AsyncMock(return_value="ts123")
-        content = await engine._generate_and_publish()
+        """Content is PUBLISHED only if Notion or Slack succeeds (None = Notion disabled)"""
+        if notion_result is None:
+            engine.notion = None
+        else:
+            _set_result(mock_notion_adapter.create_content_page, notion_result)
+        _set_result(mock_slack_adapter.send_content_notification, slack_result)
+
+        await engine._generate_and_publish()
         update_call = mock_repository.update_content.call_args[0][0]
-        assert update_call.status == ContentStatus.PUBLISHED
+        assert update_call.status == expected
 
     @pytest.mark.asyncio
-    @patch("src.core.engine.ErrorHandler.execute_with_retry")
     async def test_execution_log_records_duration(self, mock_retry, engine, mock_repository):
         """Execution log should record duration_ms > 0"""
-        mock_retry.return_value = ContentRecord(
-            id=1,
-            title="T",
-            category=Category.NETWORK,
-            difficulty=Difficulty.INTERMEDIATE,
-            summary="S",
-            content="S",
-            tags=[],
-            author="A",
-            status=ContentStatus.DRAFT,
-        )
-        mock_repository.save_execution_log.return_value = ExecutionLog(
-            id=1, status=ExecutionStatus.PENDING
-        )
+        mock_retry.return_value = _SAMPLE_CONTENT
 
         await engine._execute_content_generation()
         # update_execution_log should be called with duration_ms > 0
@@ -240,149 +285,111 @@ class TestContentGeneration:
         assert final_log.duration_ms >= 0
 
 
+@pytest.mark.parametrize("engine", [None], indirect=True)
 class TestContentGenerationWithoutNotion:
     """Tests for content generation when Notion is not configured"""
 
-    @pytest.fixture
-    def engine_no_notion(self, mock_settings, mock_repository, mock_generator, mock_slack_adapter):
-        """Create CoreEngine without Notion adapter"""
-        from config.settings import get_settings
-
-        get_settings.cache_clear()
-
-        with patch("src.core.engine.AsyncIOScheduler") as MockScheduler:
-            scheduler_instance = MagicMock()
-            scheduler_instance.get_job.return_value = None
-            MockScheduler.return_value = scheduler_instance
-
-            from src.core.engine import CoreEngine
-
-            e = CoreEngine(
-                repository=mock_repository,
-                generator=mock_generator,
-                slack_adapter=mock_slack_adapter,
-                notion_adapter=None,
-            )
-            e.scheduler = scheduler_instance
-            yield e
-
     @pytest.mark.asyncio
     async def test_publish_without_notion(
-        self, engine_no_notion, mock_repository, mock_generator, mock_slack_adapter
+        self, engine, mock_repository, mock_generator, mock_slack_adapter
     ):
         """Content should be published via Slack only when Notion is None"""
-        content = await engine_no_notion._generate_and_publish()
+        content = await engine._generate_and_publish()
         mock_generator.generate_random.assert_awaited_once()
         mock_repository.save_content.assert_awaited()
         mock_slack_adapter.send_content_notification.assert_awaited()
         mock_repository.update_content.assert_awaited()
 
-    @pytest.mark.asyncio
-    async def test_publish_without_notion_status_published(
-        self, engine_no_notion, mock_repository, mock_slack_adapter
-    ):
-        """Content should be PUBLISHED when Slack succeeds and Notion is None"""
-        mock_slack_adapter.send_content_notification = AsyncMock(return_value="ts123")
-        content = await engine_no_notion._generate_and_publish()
-        update_call = mock_repository.update_content.call_args[0][0]
-        assert update_call.status == ContentStatus.PUBLISHED
 
+class TestCommandHandlers:
     @pytest.mark.asyncio
-    async def test_publish_without_notion_slack_fails_stays_draft(
-        self, engine_no_notion, mock_repository, mock_slack_adapter
+    @pytest.mark.parametrize(
+        "schedules, expected, awaited_method",
+        [
+            (
+                [Schedule(id=1, time="07:00", status=ScheduleStatus.ACTIVE)],
+                "변경",
+                "update_schedule",
+            ),
+            ([], "생성", "save_schedule"),
+        ],
+        ids=["updates-existing", "creates-new"],
+    )
+    async def test_time_command(self, engine, mock_repository, schedules, expected, awaited_method):
+        mock_repository.list_schedules.return_value = schedules
+        result = await engine._handle_time_command("08:00", "U123", "C123")
+        assert expected in result
+        getattr(mock_repository, awaited_method).assert_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "handler, existing, expected, awaited_method",
+        [
+            ("_handle_add_command", None, "추가", "save_schedule"),
+            ("_handle_add_command", Schedule(id=1, time="09:30"), "이미", None),
+            ("_handle_remove_command", Schedule(id=1, time="09:30"), "삭제", "delete_schedule"),
+            ("_handle_remove_command", None, "찾을 수 없", None),
+        ],
+        ids=["add-success", "add-duplicate", "remove-success", "remove-not-found"],
+    )
+    async def test_schedule_commands(
+        self, engine, mock_repository, handler, existing, expected, awaited_method
     ):
-        """Content should stay DRAFT when both Notion is None and Slack fails"""
-        mock_slack_adapter.send_content_notification = AsyncMock(
-            side_effect=Exception("Slack fail")
-        )
-        content = await engine_no_notion._generate_and_publish()
-        update_call = mock_repository.update_content.call_args[0][0]
-        assert update_call.status == ContentStatus.DRAFT
-
+        mock_repository.get_schedule_by_time_return = existing
+        result = await getattr(engine, handler)("09:30", "U123", "C123")
+        assert expected in result
+        if awaited_method:
+            getattr(mock_repository, awaited_method).assert_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "schedules, expected",
+        [
+            (
+                [
+                    Schedule(id=1, time="07:00", status=ScheduleStatus.ACTIVE),
+                    Schedule(id=2, time="19:00", status=ScheduleStatus.ACTIVE),
+                ],
+                ["07:00", "19:00"],
+            ),
+            ([], ["없습니다"]),
+        ],
+        ids=["with-schedules", "empty"],
+    )
+    async def test_list_command(self, engine, mock_repository, schedules, expected):
+        mock_repository.list_schedules.return_value = schedules
+        result = await engine._handle_list_command("U123", "C123")
+        for text in expected:
+            assert text in result
 
-class TestCommandHandlers:
     @pytest.mark.asyncio
-    async def test_time_command_updates_existing(self, engine, mock_repository):
+    async def test_list_command_reuses_parsed_schedule_time(self, engine, mock_repository):
         schedule = Schedule(id=1, time="07:00", status=ScheduleStatus.ACTIVE)
+        engine._add_schedule_job(schedule)
         mock_repository.list_schedules.return_value = [schedule]
-        result = await engine._handle_time_command("08:00", "U123", "C123")
-        assert "변경" in result
-        mock_repository.update_schedule.assert_awaited()
-
-    @pytest.mark.asyncio
-    async def test_time_command_creates_new(self, engine, mock_repository):
-        mock_repository.list_schedules.return_value = []
-        result = await engine._handle_time_command("08:00", "U123", "C123")
-        assert "생성" in result
-        mock_repository.save_schedule.assert_awaited()
-
-    @pytest.mark.asyncio
-    async def test_add_command_success(self, engine, mock_repository):
-        mock_repository.get_schedule_by_time.return_value = None
-        result = await engine._handle_add_command("09:30", "U123", "C123")
-        assert "추가" in result
-        mock_repository.save_schedule.assert_awaited()
-
-    @pytest.mark.asyncio
-    async def test_add_command_duplicate(self, engine, mock_repository):
-        mock_repository.get_schedule_by_time.return_value = Schedule(id=1, time="09:30")
-        result = await engine._handle_add_command("09:30", "U123", "C123")
-        assert "이미" in result
-
-    @pytest.mark.asyncio
-    async def test_remove_command_success(self, engine, mock_repository):
-        mock_repository.get_schedule_by_time.return_value = Schedule(id=1, time="09:30")
-        result = await engine._handle_remove_command("09:30", "U123", "C123")
-        assert "삭제" in result
-        mock_repository.delete_schedule.assert_awaited()
-
-    @pytest.mark.asyncio
-    async def test_remove_command_not_found(self, engine, mock_repository):
-        mock_repository.get_schedule_by_time.return_value = None
-        result = await engine._handle_remove_command("09:30", "U123", "C123")
-        assert "찾을 수 없" in result
-
-    @pytest.mark.asyncio
-    async def test_list_command(self, engine, mock_repository):
-        mock_repository.list_schedules.return_value = [
-            Schedule(id=1, time="07:00", status=ScheduleStatus.ACTIVE),
-            Schedule(id=2, time="19:00", status=ScheduleStatus.ACTIVE),
-        ]
-        result = await engine._handle_list_command("U123", "C123")
+        with patch("src.core.engine.parse_time") as mock_parse:
+            result = await engine._handle_list_command("U123", "C123")
         assert "07:00" in result
-        assert "19:00" in result
-
-    @pytest.mark.asyncio
-    async def test_list_command_empty(self, engine, mock_repository):
-        mock_repository.list_schedules.return_value = []
-        result = await engine._handle_list_command("U123", "C123")
-        assert "없습니다" in result
-
-    @pytest.mark.asyncio
-    async def test_pause_command(self, engine):
-        engine._is_paused = False
-        result = await engine._handle_pause_command("U123", "C123")
-        assert engine._is_paused is True
-        assert "일시정지" in result
-
-    @pytest.mark.asyncio
-    async def test_pause_already_paused(self, engine):
-        engine._is_paused = True
-        result = await engine._handle_pause_command("U123", "C123")
-        assert "이미" in result
-
-    @pytest.mark.asyncio
-    async def test_resume_command(self, engine):
-        engine._is_paused = True
-        result = await engine._handle_resume_command("U123", "C123")
-        assert engine._is_paused is False
-        assert "재개" in result
-
-    @pytest.mark.asyncio
-    async def test_resume_already_running(self, engine):
-        engine._is_paused = False
-        result = await engine._handle_resume_command("U123", "C123")
-        assert "이미" in result
+        mock_parse.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "handler, paused_before, paused_after, expected",
+        [
+            ("_handle_pause_command", False, True, "일시정지"),
+            ("_handle_pause_command", True, True, "이미"),
+            ("_handle_resume_command", True, False, "재개"),
+            ("_handle_resume_command", False, False, "이미"),
+        ],
+        ids=["pause", "pause-already-paused", "resume", "resume-already-running"],
+    )
+    async def test_pause_resume_commands(
+        self, bare_engine, handler, paused_before, paused_after, expected
+    ):
+        bare_engine._is_paused = paused_before
+        result = await getattr(bare_engine, handler)("U123", "C123")
+        assert bare_engine._is_paused is paused_after
+        assert expected in result
 
     @pytest.mark.asyncio
     @patch("src.core.engine.create_background_task")
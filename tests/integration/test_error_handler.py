@@ -2,13 +2,16 @@
 Integration tests for src/errors/handler.py
 """
 
+import random
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from tenacity import AsyncRetrying
 
 from src.domain.enums import ExecutionStatus
 from src.domain.models import ExecutionLog
+from src.errors import handler as handler_module
 from src.errors.handler import (
     ErrorHandler,
     NonRetryableError,
@@ -17,62 +20,101 @@ from src.errors.handler import (
 )
 
 
+def seq(*items):
+    """Async callable returning items in order, repeating the last; exceptions are raised"""
+
+    async def _call(*args, **kwargs):
+        _call.calls += 1
+        item = items[min(_call.calls, len(items)) - 1]
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+    _call.calls = 0
+    return _call
+
+
+@pytest.fixture(autouse=True)
+def mock_sleep(monkeypatch):
+    """Replace asyncio.sleep in the handler so retries never wait"""
+    m = AsyncMock()
+    monkeypatch.setattr("src.errors.handler.asyncio.sleep", m)
+    return m
+
+
+@pytest.fixture(autouse=True)
+def seeded_random():
+    """Make backoff jitter deterministic"""
+    state = random.getstate()
+    random.seed(0)
+    yield
+    random.setstate(state)
+
+
+@pytest.fixture(scope="module")
+def handler():
+    """Shared handler; the tests only read its configuration"""
+    return ErrorHandler(max_retries=3, base_interval=1)
+
+
 class TestExecuteWithRetry:
     """Tests for execute_with_retry method"""
 
-    @pytest.fixture
-    def handler(self):
-        return ErrorHandler(max_retries=3, base_interval=1)
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def execution_log(self):
         return ExecutionLog(id=1, status=ExecutionStatus.PENDING)
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def update_callback(self):
         return AsyncMock()
 
-    @pytest.mark.asyncio
-    @patch("src.errors.handler.asyncio.sleep", new_callable=AsyncMock)
-    async def test_success_on_first_attempt(self, mock_sleep, handler):
-        func = AsyncMock(return_value="result")
-        result = await handler.execute_with_retry(func)
-        assert result == "result"
-        func.assert_awaited_once()
-        mock_sleep.assert_not_awaited()
+    @pytest.fixture(autouse=True)
+    def _reset_log(self, execution_log, update_callback):
+        """Return the shared log and callback to a fresh state before each test"""
+        execution_log.status = ExecutionStatus.PENDING
+        execution_log.attempt_count = 0
+        execution_log.error_message = None
+        execution_log.completed_at = None
+        update_callback.reset_mock()
 
     @pytest.mark.asyncio
-    @patch("src.errors.handler.asyncio.sleep", new_callable=AsyncMock)
-    async def test_success_after_retry(self, mock_sleep, handler):
-        func = AsyncMock(side_effect=[Exception("fail"), "result"])
-        result = await handler.execute_with_retry(func)
-        assert result == "result"
-        assert func.await_count == 2
-        mock_sleep.assert_awaited_once()
-
-    @pytest.mark.asyncio
-    @patch("src.errors.handler.asyncio.sleep", new_callable=AsyncMock)
-    async def test_all_retries_exhausted(self, mock_sleep, handler):
-        func = AsyncMock(side_effect=Exception("always fails"))
-        with pytest.raises(Exception, match="always fails"):
-            await handler.execute_with_retry(func)
-        assert func.await_count == 3  # max_retries = 3
-
-    @pytest.mark.asyncio
-    @patch("src.errors.handler.asyncio.sleep", new_callable=AsyncMock)
-    async def test_non_retryable_error_stops(self, mock_sleep, handler):
-        func = AsyncMock(side_effect=NonRetryableError("fatal"))
-        with pytest.raises(NonRetryableError):
-            await handler.execute_with_retry(func)
-        func.assert_awaited_once()
-        mock_sleep.assert_not_awaited()
+    @pytest.mark.parametrize(
+        "side_effect, expected_awaits, expected_sleeps, expected_error",
+        [
+            (("result",), 1, [], None),
+            ((Exception("fail"), "result"), 2, [60], None),
+            ((Exception("fail1"), Exception("fail2"), "result"), 3, [60, 120], None),
+            ((Exception("always fails"),), 3, [60, 120], Exception),
+            ((NonRetryableError("fatal"),), 1, [], NonRetryableError),
+        ],
+        ids=[
+            "first-attempt",
+            "after-one-retry",
+            "after-two-retries",
+            "all-retries-exhausted",
+            "non-retryable-stops",
+        ],
+    )
+    async def test_retry_outcomes(
+        self, mock_sleep, handler, side_effect, expected_awaits, expected_sleeps, expected_error
+    ):
+        # base_interval=1 and max_retries=3: waits are jittered within [w/2, w]
+        # of w = 2**(attempt-1) * 60 seconds
+        func = seq(*side_effect)
+        if expected_error:
+            with pytest.raises(expected_error):
+                await handler.execute_with_retry(func)
+        else:
+            assert await handler.execute_with_retry(func) == "result"
+        assert func.calls == expected_awaits
+        sleeps = [c.args[0] for c in mock_sleep.await_args_list]
+        assert len(sleeps) == len(expected_sleeps)
+        for slept, ceiling in zip(sleeps, expected_sleeps, strict=True):
+            assert ceiling * 0.5 <= slept <= ceiling
 
     @pytest.mark.asyncio
-    @patch("src.errors.handler.asyncio.sleep", new_callable=AsyncMock)
-    async def test_updates_execution_log_on_success(
-        self, mock_sleep, handler, execution_log, update_callback
-    ):
-        func = AsyncMock(return_value="ok")
+    async def test_updates_execution_log_on_success(self, handler, execution_log, update_callback):
+        func = seq("ok")
         await handler.execute_with_retry(
             func, execution_log=execution_log, update_log_callback=update_callback
         )
@@ -81,11 +123,8 @@ class TestExecuteWithRetry:
         assert update_callback.await_count >= 1
 
     @pytest.mark.asyncio
-    @patch("src.errors.handler.asyncio.sleep", new_callable=AsyncMock)
-    async def test_updates_execution_log_on_failure(
-        self, mock_sleep, handler, execution_log, update_callback
-    ):
-        func = AsyncMock(side_effect=Exception("fail"))
+    async def test_updates_execution_log_on_failure(self, handler, execution_log, update_callback):
+        func = seq(Exception("fail"))
         with pytest.raises(Exception, match="fail"):
             await handler.execute_with_retry(
                 func, execution_log=execution_log, update_log_callback=update_callback
@@ -93,32 +132,52 @@ class TestExecuteWithRetry:
         assert execution_log.status == ExecutionStatus.FAILED
 
     @pytest.mark.asyncio
-    @patch("src.errors.handler.asyncio.sleep", new_callable=AsyncMock)
-    async def test_calls_error_callback_on_final_fail(self, mock_sleep):
+    async def test_drives_attempts_with_tenacity(self, monkeypatch, handler):
+        spy = MagicMock(wraps=AsyncRetrying)
+        monkeypatch.setattr(handler_module, "AsyncRetrying", spy)
+        func = seq(Exception("fail"), "ok")
+        assert await handler.execute_with_retry(func) == "ok"
+        spy.assert_called_once()
+        kwargs = spy.call_args.kwargs
+        assert kwargs["reraise"] is True
+        assert kwargs["stop"].max_attempt_number == handler.max_retries
+
+    @pytest.mark.asyncio
+    async def test_calls_error_callback_on_final_fail(self):
         error_cb = AsyncMock()
         handler = ErrorHandler(max_retries=2, base_interval=1, on_error_callback=error_cb)
-        func = AsyncMock(side_effect=Exception("error"))
+        func = seq(Exception("error"))
         with pytest.raises(Exception, match="error"):
             await handler.execute_with_retry(func)
         error_cb.assert_awaited_once()
 
     @pytest.mark.asyncio
-    @patch("src.errors.handler.asyncio.sleep", new_callable=AsyncMock)
-    async def test_increments_attempt_count(
-        self, mock_sleep, handler, execution_log, update_callback
-    ):
-        func = AsyncMock(side_effect=[Exception("fail"), "ok"])
+    async def test_pre_attempt_log_failure_propagates(self, mock_sleep, execution_log):
+        error_cb = AsyncMock()
+        handler = ErrorHandler(max_retries=3, base_interval=1, on_error_callback=error_cb)
+        failing_update = AsyncMock(side_effect=RuntimeError("db down"))
+        func = seq("ok")
+        with pytest.raises(RuntimeError, match="db down"):
+            await handler.execute_with_retry(
+                func, execution_log=execution_log, update_log_callback=failing_update
+            )
+        # Not treated as a failed attempt: no call, no retry, no FAILED path
+        assert func.calls == 0
+        mock_sleep.assert_not_awaited()
+        error_cb.assert_not_awaited()
+        assert execution_log.status == ExecutionStatus.RUNNING
+
+    @pytest.mark.asyncio
+    async def test_increments_attempt_count(self, handler, execution_log, update_callback):
+        func = seq(Exception("fail"), "ok")
         await handler.execute_with_retry(
             func, execution_log=execution_log, update_log_callback=update_callback
         )
         assert execution_log.attempt_count == 2
 
     @pytest.mark.asyncio
-    @patch("src.errors.handler.asyncio.sleep", new_callable=AsyncMock)
-    async def test_sets_error_message_on_failure(
-        self, mock_sleep, handler, execution_log, update_callback
-    ):
-        func = AsyncMock(side_effect=Exception("specific error"))
+    async def test_sets_error_message_on_failure(self, handler, execution_log, update_callback):
+        func = seq(Exception("specific error"))
         with pytest.raises(Exception, match="specific error"):
             await handler.execute_with_retry(
                 func, execution_log=execution_log, update_log_callback=update_callback
@@ -126,11 +185,8 @@ class TestExecuteWithRetry:
         assert execution_log.error_message == "specific error"
 
     @pytest.mark.asyncio
-    @patch("src.errors.handler.asyncio.sleep", new_callable=AsyncMock)
-    async def test_sets_completed_at_on_success(
-        self, mock_sleep, handler, execution_log, update_callback
-    ):
-        func = AsyncMock(return_value="ok")
+    async def test_sets_completed_at_on_success(self, handler, execution_log, update_callback):
+        func = seq("ok")
         await handler.execute_with_retry(
             func, execution_log=execution_log, update_log_callback=update_callback
         )
@@ -138,11 +194,8 @@ class TestExecuteWithRetry:
         assert isinstance(execution_log.completed_at, datetime)
 
     @pytest.mark.asyncio
-    @patch("src.errors.handler.asyncio.sleep", new_callable=AsyncMock)
-    async def test_sets_completed_at_on_failure(
-        self, mock_sleep, handler, execution_log, update_callback
-    ):
-        func = AsyncMock(side_effect=Exception("fail"))
+    async def test_sets_completed_at_on_failure(self, handler, execution_log, update_callback):
+        func = seq(Exception("fail"))
         with pytest.raises(Exception, match="fail"):
             await handler.execute_with_retry(
                 func, execution_log=execution_log, update_log_callback=update_callback
@@ -151,23 +204,8 @@ class TestExecuteWithRetry:
         assert isinstance(execution_log.completed_at, datetime)
 
     @pytest.mark.asyncio
-    @patch("src.errors.handler.asyncio.sleep", new_callable=AsyncMock)
-    async def test_wait_time_increases_with_attempts(self, mock_sleep, handler):
-        func = AsyncMock(side_effect=[Exception("fail1"), Exception("fail2"), "ok"])
-        await handler.execute_with_retry(func)
-        # base_interval=1, so wait times should be 1*1*60=60, then 1*2*60=120
-        assert mock_sleep.await_count == 2
-        # Check first wait is 60 seconds (1 minute * attempt 1)
-        assert mock_sleep.await_args_list[0][0][0] == 60
-        # Check second wait is 120 seconds (1 minute * attempt 2)
-        assert mock_sleep.await_args_list[1][0][0] == 120
-
-    @pytest.mark.asyncio
-    @patch("src.errors.handler.asyncio.sleep", new_callable=AsyncMock)
-    async def test_status_transitions_correctly(
-        self, mock_sleep, handler, execution_log, update_callback
-    ):
-        func = AsyncMock(side_effect=[Exception("fail"), "ok"])
+    async def test_status_transitions_correctly(self, handler, execution_log, update_callback):
+        func = seq(Exception("fail"), "ok")
         await handler.execute_with_retry(
             func, execution_log=execution_log, update_log_callback=update_callback
         )
@@ -176,6 +214,7 @@ class TestExecuteWithRetry:
         assert execution_log.status == ExecutionStatus.SUCCESS
 
 
+@pytest.mark.usefixtures("mock_settings")
 class TestCalculateNextRetryTime:
     def test_returns_datetime(self):
         handler = ErrorHandler(max_retries=5, base_interval=5)
@@ -189,149 +228,131 @@ class TestCalculateNextRetryTime:
         # time2 should be later than time1
         assert time2 > time1
 
+    @pytest.mark.parametrize("attempt, ceiling", [(1, 300), (2, 600), (4, 2400), (10, 9600)])
+    def test_backoff_is_exponential_with_cap(self, attempt, ceiling):
+        handler = ErrorHandler(max_retries=5, base_interval=5)
+        for _ in range(20):
+            assert ceiling * 0.5 <= handler._backoff_seconds(attempt) <= ceiling
+
 
 class TestShouldRetry:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def handler(self):
         return ErrorHandler(max_retries=5, base_interval=5)
 
-    def test_under_max_returns_true(self, handler):
-        assert handler.should_retry(1, RetryableError("err")) is True
-
-    def test_at_max_returns_false(self, handler):
-        assert handler.should_retry(5, RetryableError("err")) is False
-
-    def test_over_max_returns_false(self, handler):
-        assert handler.should_retry(6, RetryableError("err")) is False
-
-    def test_non_retryable_returns_false(self, handler):
-        assert handler.should_retry(1, NonRetryableError("err")) is False
-
-    def test_timeout_error_returns_true(self, handler):
-        assert handler.should_retry(1, Exception("timeout occurred")) is True
-
-    def test_connection_error_returns_true(self, handler):
-        assert handler.should_retry(1, Exception("connection refused")) is True
-
-    def test_rate_limit_error_returns_true(self, handler):
-        assert handler.should_retry(1, Exception("rate limit exceeded")) is True
-
-    def test_503_error_returns_true(self, handler):
-        assert handler.should_retry(1, Exception("HTTP 503 Service Unavailable")) is True
-
-    def test_502_error_returns_true(self, handler):
-        assert handler.should_retry(1, Exception("HTTP 502 Bad Gateway")) is True
-
-    def test_500_error_returns_true(self, handler):
-        assert handler.should_retry(1, Exception("HTTP 500 Internal Server Error")) is True
-
-    def test_temporarily_error_returns_true(self, handler):
-        assert handler.should_retry(1, Exception("temporarily unavailable")) is True
-
-    def test_unknown_error_returns_false(self, handler):
-        assert handler.should_retry(1, Exception("some random error")) is False
-
-    def test_retryable_error_instance_returns_true(self, handler):
-        assert handler.should_retry(1, RetryableError("retry this")) is True
+    @pytest.mark.parametrize(
+        "attempt, error, expected",
+        [
+            (1, RetryableError("err"), True),
+            (5, RetryableError("err"), False),
+            (6, RetryableError("err"), False),
+            (1, NonRetryableError("err"), False),
+            (1, Exception("timeout occurred"), True),
+            (1, Exception("connection refused"), True),
+            (1, Exception("rate limit exceeded"), True),
+            (1, Exception("HTTP 503 Service Unavailable"), True),
+            (1, Exception("HTTP 502 Bad Gateway"), True),
+            (1, Exception("HTTP 500 Internal Server Error"), True),
+            (1, Exception("temporarily unavailable"), True),
+            (1, Exception("some random error"), False),
+            (1, RetryableError("retry this"), True),
+        ],
+        ids=[
+            "under-max",
+            "at-max",
+            "over-max",
+            "non-retryable",
+            "timeout",
+            "connection",
+            "rate-limit",
+            "503",
+            "502",
+            "500",
+            "temporarily",
+            "unknown",
+            "retryable-instance",
+        ],
+    )
+    def test_should_retry(self, handler, attempt, error, expected):
+        assert handler.should_retry(attempt, error) is expected
 
 
 class TestIsRetryableError:
-    def test_retryable_error_returns_true(self):
-        assert is_retryable_error(RetryableError("err")) is True
-
-    def test_non_retryable_returns_false(self):
-        assert is_retryable_error(NonRetryableError("err")) is False
-
-    def test_timeout_returns_true(self):
-        assert is_retryable_error(Exception("timeout")) is True
-
-    def test_connection_refused_returns_true(self):
-        assert is_retryable_error(Exception("connection refused")) is True
-
-    def test_connection_reset_returns_true(self):
-        assert is_retryable_error(Exception("connection reset")) is True
-
-    def test_rate_limit_returns_true(self):
-        assert is_retryable_error(Exception("rate limit")) is True
-
-    def test_too_many_requests_returns_true(self):
-        assert is_retryable_error(Exception("too many requests")) is True
-
-    def test_service_unavailable_returns_true(self):
-        assert is_retryable_error(Exception("service unavailable")) is True
-
-    def test_bad_gateway_returns_true(self):
-        assert is_retryable_error(Exception("bad gateway")) is True
-
-    def test_internal_server_error_returns_true(self):
-        assert is_retryable_error(Exception("internal server error")) is True
-
-    def test_temporarily_unavailable_returns_true(self):
-        assert is_retryable_error(Exception("temporarily unavailable")) is True
-
-    def test_unknown_returns_false(self):
-        assert is_retryable_error(Exception("random")) is False
-
-    def test_case_insensitive(self):
-        assert is_retryable_error(Exception("TIMEOUT")) is True
-        assert is_retryable_error(Exception("Connection Refused")) is True
+    @pytest.mark.parametrize(
+        "error, expected",
+        [
+            (RetryableError("err"), True),
+            (NonRetryableError("err"), False),
+            (Exception("timeout"), True),
+            (Exception("connection refused"), True),
+            (Exception("connection reset"), True),
+            (Exception("rate limit"), True),
+            (Exception("too many requests"), True),
+            (Exception("service unavailable"), True),
+            (Exception("bad gateway"), True),
+            (Exception("internal server error"), True),
+            (Exception("temporarily unavailable"), True),
+            (Exception("random"), False),
+            (Exception("TIMEOUT"), True),
+            (Exception("Connection Refused"), True),
+        ],
+        ids=lambda v: f"{type(v).__name__}({v})" if isinstance(v, Exception) else None,
+    )
+    def test_is_retryable_error(self, error, expected):
+        assert is_retryable_error(error) is expected
+
+    def test_uses_single_compiled_search(self, monkeypatch):
+        """All indicators are checked by one search over the message"""
+        pattern = MagicMock(wraps=handler_module._RETRY_RE)
+        monkeypatch.setattr(handler_module, "_RETRY_RE", pattern)
+        assert is_retryable_error(Exception("upstream bad gateway after connection reset"))
+        assert pattern.search.call_count == 1
 
 
 class TestExtractRetryAfter:
-    def test_returns_none_for_normal_error(self):
-        handler = ErrorHandler(max_retries=3, base_interval=1)
+    def test_returns_none_for_normal_error(self, handler):
         result = handler._extract_retry_after(Exception("normal error"))
         assert result is None
 
-    def test_returns_30_for_429_error(self):
-        handler = ErrorHandler(max_retries=3, base_interval=1)
-        result = handler._extract_retry_after(Exception("HTTP 429 Too Many Requests"))
-        assert result == 30
-
-    def test_returns_30_for_rate_limit_error(self):
-        handler = ErrorHandler(max_retries=3, base_interval=1)
-        result = handler._extract_retry_after(Exception("rate_limited"))
-        assert result == 30
-
-    def test_extracts_retry_after_header(self):
-        handler = ErrorHandler(max_retries=3, base_interval=1)
+    @pytest.mark.parametrize(
+        "msg",
+        ["HTTP 429 Too Many Requests", "rate_limited", "error 429", "Rate_Limit exceeded"],
+    )
+    def test_returns_30_for_rate_limit_errors(self, handler, msg):
+        assert handler._extract_retry_after(Exception(msg)) == 30
+
+    def test_uses_single_compiled_search(self, monkeypatch, handler):
+        """Rate-limit markers are checked by one search over the message"""
+        pattern = MagicMock(wraps=handler_module._RATE_LIMIT_RE)
+        monkeypatch.setattr(handler_module, "_RATE_LIMIT_RE", pattern)
+        assert handler._extract_retry_after(Exception("rate limit hit")) == 30
+        assert pattern.search.call_count == 1
+
+    def test_extracts_retry_after_header(self, handler):
         error = Exception("api error")
         error.response = MagicMock()
         error.response.headers = {"Retry-After": "60"}
         result = handler._extract_retry_after(error)
         assert result == 60
 
-    def test_extracts_retry_after_header_as_int(self):
-        handler = ErrorHandler(max_retries=3, base_interval=1)
+    def test_extracts_retry_after_header_as_int(self, handler):
         error = Exception("api error")
         error.response = MagicMock()
         error.response.headers = {"Retry-After": "120"}
         result = handler._extract_retry_after(error)
         assert result == 120
 
-    def test_returns_none_when_no_response_attribute(self):
-        handler = ErrorHandler(max_retries=3, base_interval=1)
+    def test_returns_none_when_no_response_attribute(self, handler):
         error = Exception("no response attribute")
         result = handler._extract_retry_after(error)
         assert result is None
 
-    def test_returns_none_when_no_headers_attribute(self):
-        handler = ErrorHandler(max_retries=3, base_interval=1)
+    def test_returns_none_when_no_headers_attribute(self, handler):
         error = Exception("no headers")
         error.response = MagicMock(spec=[])
         result = handler._extract_retry_after(error)
         assert result is None
 
-    def test_429_in_lowercase(self):
-        handler = ErrorHandler(max_retries=3, base_interval=1)
-        result = handler._extract_retry_after(Exception("error 429"))
-        assert result == 30
-
-    def test_rate_limit_case_insensitive(self):
-        handler = ErrorHandler(max_retries=3, base_interval=1)
-        result = handler._extract_retry_after(Exception("Rate_Limit exceeded"))
-        assert result == 30
-
 
 class TestCreateRetryDecorator:
     def test_creates_decorator_with_default_settings(self):
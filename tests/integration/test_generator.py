@@ -2,13 +2,17 @@
 Integration tests for src/generators/claude_code_generator.py
 """
 
+import asyncio
 import json
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
+from config.topics import get_all_topics
 from src.domain.enums import Category, Difficulty
 from src.domain.models import GeneratedContent
+from src.generators import claude_code_generator as generator_module
 from src.generators.base import GenerationError
 from src.generators.claude_code_generator import ClaudeCodeGenerator
 
@@ -18,21 +22,72 @@ def generator():
     return ClaudeCodeGenerator(timeout=180)
 
 
-def _make_mock_process(stdout="", stderr="", returncode=0):
-    """Helper to create mock subprocess"""
-    process = AsyncMock()
-    process.communicate = AsyncMock(return_value=(stdout.encode("utf-8"), stderr.encode("utf-8")))
-    process.returncode = returncode
-    return process
+def _encode(data):
+    return json.dumps(data).encode("utf-8")
+
+
+# CLI outputs encoded once at import
+_MARKDOWN_PAYLOAD = (
+    "Some text\n```json\n"
+    + json.dumps({"title": "Test Title", "summary": "Test summary", "tags": ["t1"]})
+    + "\n```\nMore text"
+).encode("utf-8")
+_RAW_PAYLOAD = _encode({"title": "Raw Title", "summary": "Raw summary", "tags": []})
+_RANDOM_PAYLOAD = _encode({"title": "Random", "summary": "Summary", "tags": []})
+_MISSING_TITLE_PAYLOAD = _encode({"summary": "no title"})
+_MISSING_SUMMARY_PAYLOAD = _encode({"title": "no summary"})
+
+
+@pytest.fixture(autouse=True)
+def mock_exec(monkeypatch):
+    """Stub subprocess creation; tests set return_value or side_effect"""
+    m = AsyncMock()
+    monkeypatch.setattr("src.generators.claude_code_generator.asyncio.create_subprocess_exec", m)
+    return m
+
+
+class _FakeProc:
+    """Minimal stand-in for asyncio.subprocess.Process"""
+
+    __slots__ = ("_err", "_out", "_raise", "returncode")
+
+    def __init__(self, out=b"", err=b"", rc=0, raise_=None):
+        self.returncode = rc
+        self._out = out
+        self._err = err
+        self._raise = raise_
+
+    async def communicate(self, input=None):
+        if self._raise:
+            raise self._raise
+        return self._out, self._err
+
+
+class _BarrierProc(_FakeProc):
+    """Fake process whose output is held until ``parties`` calls wait on it at once"""
+
+    __slots__ = ("_barrier",)
+
+    def __init__(self, out, parties):
+        super().__init__(out)
+        self._barrier = asyncio.Barrier(parties)
+
+    async def communicate(self, input=None):
+        await self._barrier.wait()
+        return await super().communicate(input)
+
+
+def _make_mock_process(stdout="", stderr="", returncode=0, stdout_bytes=None, raise_=None):
+    """Build a fake subprocess; pass stdout_bytes to skip encoding"""
+    return _FakeProc(
+        stdout_bytes or stdout.encode("utf-8"), stderr.encode("utf-8"), returncode, raise_
+    )
 
 
 class TestGenerate:
     @pytest.mark.asyncio
-    @patch("src.generators.claude_code_generator.asyncio.create_subprocess_exec")
     async def test_parses_json_in_markdown_block(self, mock_exec, generator):
-        data = {"title": "Test Title", "summary": "Test summary", "tags": ["t1"]}
-        stdout = f"Some text\n```json\n{json.dumps(data)}\n```\nMore text"
-        mock_exec.return_value = _make_mock_process(stdout=stdout)
+        mock_exec.return_value = _make_mock_process(stdout_bytes=_MARKDOWN_PAYLOAD)
 
         result = await generator.generate("Test", Category.NETWORK, Difficulty.INTERMEDIATE)
         assert isinstance(result, GeneratedContent)
@@ -40,17 +95,13 @@ class TestGenerate:
         assert result.summary == "Test summary"
 
     @pytest.mark.asyncio
-    @patch("src.generators.claude_code_generator.asyncio.create_subprocess_exec")
     async def test_parses_raw_json(self, mock_exec, generator):
-        data = {"title": "Raw Title", "summary": "Raw summary", "tags": []}
-        stdout = json.dumps(data)
-        mock_exec.return_value = _make_mock_process(stdout=stdout)
+        mock_exec.return_value = _make_mock_process(stdout_bytes=_RAW_PAYLOAD)
 
         result = await generator.generate("Test", Category.NETWORK, Difficulty.BEGINNER)
         assert result.title == "Raw Title"
 
     @pytest.mark.asyncio
-    @patch("src.generators.claude_code_generator.asyncio.create_subprocess_exec")
     async def test_raises_on_no_json_found(self, mock_exec, generator):
         mock_exec.return_value = _make_mock_process(stdout="no json here")
 
@@ -58,7 +109,6 @@ class TestGenerate:
             await generator.generate("Test", Category.NETWORK)
 
     @pytest.mark.asyncio
-    @patch("src.generators.claude_code_generator.asyncio.create_subprocess_exec")
     async def test_raises_on_invalid_json(self, mock_exec, generator):
         mock_exec.return_value = _make_mock_process(stdout="```json\n{invalid}\n```")
 
@@ -66,35 +116,25 @@ class TestGenerate:
             await generator.generate("Test", Category.NETWORK)
 
     @pytest.mark.asyncio
-    @patch("src.generators.claude_code_generator.asyncio.create_subprocess_exec")
-    async def test_raises_on_missing_title(self, mock_exec, generator):
-        data = {"summary": "no title"}
-        mock_exec.return_value = _make_mock_process(stdout=json.dumps(data))
-
-        with pytest.raises(GenerationError, match="Missing required"):
-            await generator.generate("Test", Category.NETWORK)
-
-    @pytest.mark.asyncio
-    @patch("src.generators.claude_code_generator.asyncio.create_subprocess_exec")
-    async def test_raises_on_missing_summary(self, mock_exec, generator):
-        data = {"title": "no summary"}
-        mock_exec.return_value = _make_mock_process(stdout=json.dumps(data))
+    @pytest.mark.parametrize(
+        "payload",
+        [_MISSING_TITLE_PAYLOAD, _MISSING_SUMMARY_PAYLOAD],
+        ids=["missing-title", "missing-summary"],
+    )
+    async def test_raises_on_missing_required_field(self, mock_exec, generator, payload):
+        mock_exec.return_value = _make_mock_process(stdout_bytes=payload)
 
         with pytest.raises(GenerationError, match="Missing required"):
             await generator.generate("Test", Category.NETWORK)
 
     @pytest.mark.asyncio
-    @patch("src.generators.claude_code_generator.asyncio.create_subprocess_exec")
     async def test_raises_on_cli_timeout(self, mock_exec, generator):
-        process = AsyncMock()
-        process.communicate = AsyncMock(side_effect=TimeoutError())
-        mock_exec.return_value = process
+        mock_exec.return_value = _make_mock_process(raise_=TimeoutError())
 
         with pytest.raises(GenerationError, match="timed out"):
             await generator.generate("Test", Category.NETWORK)
 
     @pytest.mark.asyncio
-    @patch("src.generators.claude_code_generator.asyncio.create_subprocess_exec")
     async def test_raises_on_cli_not_found(self, mock_exec, generator):
         mock_exec.side_effect = FileNotFoundError()
 
@@ -102,38 +142,45 @@ class TestGenerate:
             await generator.generate("Test", Category.NETWORK)
 
     @pytest.mark.asyncio
-    @patch("src.generators.claude_code_generator.asyncio.create_subprocess_exec")
     async def test_raises_on_nonzero_returncode(self, mock_exec, generator):
         mock_exec.return_value = _make_mock_process(stderr="Error!", returncode=1)
 
         with pytest.raises(GenerationError, match="CLI failed"):
             await generator.generate("Test", Category.NETWORK)
 
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_do_not_serialize(self, mock_exec, generator):
+        mock_exec.return_value = _BarrierProc(_RAW_PAYLOAD, parties=8)
+
+        # All eight calls must be in flight together to pass the barrier; serialized
+        # calls would block on it, so the timeout only guards against a hang
+        async with asyncio.timeout(5), asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(generator.generate("T", Category.NETWORK)) for _ in range(8)]
+        assert all(task.result().title == "Raw Title" for task in tasks)
+
+
+@pytest.fixture(scope="session")
+def all_used_topics():
+    """Every topic name, as if all had already been used"""
+    return [topic for _, topic in get_all_topics()]
+
 
 class TestGenerateRandom:
     @pytest.mark.asyncio
-    @patch("src.generators.claude_code_generator.asyncio.create_subprocess_exec")
     async def test_selects_unused_topic(self, mock_exec, generator):
-        data = {"title": "Random", "summary": "Summary", "tags": []}
-        mock_exec.return_value = _make_mock_process(stdout=json.dumps(data))
+        mock_exec.return_value = _make_mock_process(stdout_bytes=_RANDOM_PAYLOAD)
 
         result = await generator.generate_random(used_topics=[])
         assert isinstance(result, GeneratedContent)
 
     @pytest.mark.asyncio
-    async def test_raises_when_all_used(self, generator):
-        from config.topics import get_all_topics
-
-        all_topics = [t[1] for t in get_all_topics()]
-
+    async def test_raises_when_all_used(self, generator, all_used_topics):
         with pytest.raises(GenerationError):
-            await generator.generate_random(used_topics=all_topics)
+            await generator.generate_random(used_topics=all_used_topics)
 
     @pytest.mark.asyncio
-    @patch("src.generators.claude_code_generator.asyncio.create_subprocess_exec")
     async def test_preferred_category(self, mock_exec, generator):
-        data = {"title": "Network Topic", "summary": "Summary", "tags": []}
-        mock_exec.return_value = _make_mock_process(stdout=json.dumps(data))
+        mock_exec.return_value = _make_mock_process(stdout_bytes=_RANDOM_PAYLOAD)
 
         result = await generator.generate_random(
             used_topics=[], preferred_category=Category.NETWORK
@@ -143,7 +190,6 @@ class TestGenerateRandom:
 
 class TestHealthCheck:
     @pytest.mark.asyncio
-    @patch("src.generators.claude_code_generator.asyncio.create_subprocess_exec")
     async def test_returns_true_on_success(self, mock_exec, generator):
         mock_exec.return_value = _make_mock_process(stdout="claude 1.0.0")
 
@@ -151,7 +197,6 @@ class TestHealthCheck:
         assert result is True
 
     @pytest.mark.asyncio
-    @patch("src.generators.claude_code_generator.asyncio.create_subprocess_exec")
     async def test_returns_false_on_failure(self, mock_exec, generator):
         mock_exec.side_effect = FileNotFoundError()
 
@@ -159,11 +204,8 @@ class TestHealthCheck:
         assert result is False
 
     @pytest.mark.asyncio
-    @patch("src.generators.claude_code_generator.asyncio.create_subprocess_exec")
     async def test_returns_false_on_timeout(self, mock_exec, generator):
-        process = AsyncMock()
-        process.communicate = AsyncMock(side_effect=TimeoutError())
-        mock_exec.return_value = process
+        mock_exec.return_value = _make_mock_process(raise_=TimeoutError())
 
         result = await generator.health_check()
         assert result is False
@@ -214,3 +256,54 @@ class TestParseResponse:
         )
         assert content.title == "Nested"
         assert content.summary == "Sum"
+
+    def test_parse_response_skips_braces_inside_strings(self, generator):
+        """Braces and escaped quotes inside strings should not end the object"""
+        data = {"title": 'Uses "{" and }', "summary": "S\\}", "tags": []}
+        response = f"noise }} {json.dumps(data)} trailing"
+        content = generator._parse_response(
+            response, "topic", Category.NETWORK, Difficulty.BEGINNER
+        )
+        assert content.title == 'Uses "{" and }'
+
+    @pytest.mark.parametrize(
+        "template",
+        ["Here is {{ the result: {} done.", "{{ draft {} }}"],
+        ids=["stray-brace", "non-json-outer-span"],
+    )
+    def test_parse_response_finds_object_after_failed_candidate(self, generator, template):
+        """A brace that never balances or an outer span that is not JSON is skipped"""
+        data = {"title": "A", "summary": "S", "tags": []}
+        response = template.format(json.dumps(data))
+        content = generator._parse_response(
+            response, "topic", Category.NETWORK, Difficulty.BEGINNER
+        )
+        assert content.title == "A"
+
+    def test_parse_response_decode_attempts_bounded_on_adversarial_input(
+        self, generator, monkeypatch
+    ):
+        """Doubling brace-heavy noise should not add decode attempts"""
+        decoder = generator_module._DECODER
+        attempts = []
+
+        def counting_raw_decode(text, idx):
+            attempts.append(idx)
+            return decoder.raw_decode(text, idx)
+
+        monkeypatch.setattr(
+            generator_module, "_DECODER", SimpleNamespace(raw_decode=counting_raw_decode)
+        )
+        payload = json.dumps({"title": "Big", "summary": "S", "tags": []})
+
+        counts = []
+        for size in (5000, 10000):
+            attempts.clear()
+            response = "{" * (4 * size) + "x" + '{"a": ' * size + "}" * (5 * size) + payload
+            content = generator._parse_response(
+                response, "topic", Category.NETWORK, Difficulty.BEGINNER
+            )
+            assert content.title == "Big"
+            counts.append(len(attempts))
+
+        assert counts[0] == counts[1]
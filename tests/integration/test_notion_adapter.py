@@ -4,7 +4,6 @@ Integration tests for src/integrations/notion/adapter.py
 
 import asyncio
 from datetime import datetime
-from unittest.mock import patch
 
 import pytest
 
@@ -13,52 +12,87 @@ from src.domain.models import ContentRecord, ReportData
 from src.integrations.notion.adapter import NotionAdapter
 
 
-@pytest.fixture
-def notion_adapter(mock_settings, mock_notion_client):
-    """Create NotionAdapter with mocked client"""
-    from config.settings import get_settings
+@pytest.fixture(scope="module")
+def _adapter_template(_settings_once, _notion_client):
+    """Build one NotionAdapter per module around the session's client mock"""
+    return NotionAdapter(client=_notion_client)
 
-    get_settings.cache_clear()
 
-    with patch("src.integrations.notion.adapter.AsyncClient") as MockClient:
-        MockClient.return_value = mock_notion_client
-        adapter = NotionAdapter()
-        adapter.client = mock_notion_client
-        yield adapter
+@pytest.fixture
+def notion_adapter(_adapter_template, mock_notion_client):
+    """Shared NotionAdapter with its client mock and caches reset"""
+    adapter = _adapter_template
+    adapter._data_source_id = None
+    adapter._schema_initialized = False
+    adapter._rate_limiter._tokens = float(adapter._rate_limiter._burst)
+    return adapter
+
+
+# Validated once; tests take cheap copies with model_copy
+_CONTENT_TEMPLATE = ContentRecord(
+    id=1,
+    title="TCP 3-way handshake",
+    category=Category.NETWORK,
+    difficulty=Difficulty.INTERMEDIATE,
+    summary="TCP 연결 수립 과정을 설명합니다.",
+    content="TCP 연결 수립 과정을 설명합니다.",
+    tags=["네트워크", "TCP"],
+    author="TestUser",
+    status=ContentStatus.DRAFT,
+)
+_REPORT_TEMPLATE = ReportData(
+    report_type=ReportType.WEEKLY,
+    period_start=datetime(2026, 1, 27),
+    period_end=datetime(2026, 2, 2),
+    total_count=7,
+    success_count=6,
+    failed_count=1,
+    retry_count=2,
+    category_distribution={"network": 3, "os": 2, "algorithm": 1},
+    uncovered_categories=["security", "devops"],
+    avg_duration_ms=10500.0,
+    min_duration_ms=8000,
+    max_duration_ms=15000,
+    generated_at=datetime(2026, 2, 3),
+)
+
+_LONG_3000 = "x" * 3000
+
+
+def make_content(**overrides):
+    """ContentRecord sample with the given fields replaced"""
+    return _CONTENT_TEMPLATE.model_copy(update=overrides)
+
+
+def make_report(**overrides):
+    """ReportData sample with the given fields replaced"""
+    return _REPORT_TEMPLATE.model_copy(update=overrides)
 
 
 @pytest.fixture
 def sample_content():
-    return ContentRecord(
-        id=1,
-        title="TCP 3-way handshake",
-        category=Category.NETWORK,
-        difficulty=Difficulty.INTERMEDIATE,
-        summary="TCP 연결 수립 과정을 설명합니다.",
-        content="TCP 연결 수립 과정을 설명합니다.",
-        tags=["네트워크", "TCP"],
-        author="TestUser",
-        status=ContentStatus.DRAFT,
-    )
+    return make_content()
 
 
 @pytest.fixture
 def sample_report():
-    return ReportData(
-        report_type=ReportType.WEEKLY,
-        period_start=datetime(2026, 1, 27),
-        period_end=datetime(2026, 2, 2),
-        total_count=7,
-        success_count=6,
-        failed_count=1,
-        retry_count=2,
-        category_distribution={"network": 3, "os": 2, "algorithm": 1},
-        uncovered_categories=["security", "devops"],
-        avg_duration_ms=10500.0,
-        min_duration_ms=8000,
-        max_duration_ms=15000,
-        generated_at=datetime(2026, 2, 3),
-    )
+    return make_report()
+
+
+class _ImmediateLock:
+    """Lock that never suspends and fails if two holders ever overlap"""
+
+    def __init__(self):
+        self.held = False
+        self.acquisitions = 0
+
+    async def __aenter__(self):
+        assert not self.held, "schema lock entered concurrently"
+        self.held = True
+        self.acquisitions += 1
+
+    async def __aexit__(self, *exc_info):
+        self.held = False
 
 
 class TestGetDataSourceId:
@@ -76,11 +110,12 @@ class TestGetDataSourceId:
         mock_notion_client.databases.retrieve.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_raises_when_no_sources(self, notion_adapter, mock_notion_client):
-        mock_notion_client.databases.retrieve.return_value = {
-            "id": "test-db-id",
-            "data_sources": [],
-        }
+    async def test_raises_when_no_sources(self, monkeypatch, notion_adapter, mock_notion_client):
+        monkeypatch.setattr(
+            mock_notion_client.databases.retrieve,
+            "return_value",
+            {"id": "test-db-id", "data_sources": []},
+        )
         with pytest.raises(RuntimeError, match="No data sources"):
             await notion_adapter._get_data_source_id()
 
@@ -110,14 +145,19 @@ class TestEnsureDatabaseSchema:
         mock_notion_client.data_sources.update.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_concurrent_schema_initialization(self, notion_adapter, mock_notion_client):
+    async def test_concurrent_schema_initialization(
+        self, monkeypatch, notion_adapter, mock_notion_client
+    ):
         """Two concurrent calls should only trigger one actual schema check"""
+        lock = _ImmediateLock()
+        monkeypatch.setattr(notion_adapter, "_schema_lock", lock)
         await asyncio.gather(
             notion_adapter._ensure_database_schema(),
             notion_adapter._ensure_database_schema(),
         )
         # data_sources.retrieve should be called exactly once (second call sees _schema_initialized)
         mock_notion_client.data_sources.retrieve.assert_awaited_once()
+        assert lock.acquisitions >= 1
 
 
 class TestCreateContentPage:
@@ -128,36 +168,29 @@ class TestCreateContentPage:
         assert url == "https://notion.so/test-page"
 
     @pytest.mark.asyncio
-    async def test_correct_properties(self, notion_adapter, sample_content, mock_notion_client):
+    async def test_create_content_page_shape(
+        self, notion_adapter, sample_content, mock_notion_client
+    ):
+        """One call covers properties, summary callout and data source parent"""
         await notion_adapter.create_content_page(sample_content)
         call_kwargs = mock_notion_client.pages.create.call_args.kwargs
+
         props = call_kwargs["properties"]
-        assert "제목" in props
-        assert "카테고리" in props
-        assert "난이도" in props
-        assert "태그" in props
+        assert {"제목", "카테고리", "난이도", "태그"} <= props.keys()
 
-    @pytest.mark.asyncio
-    async def test_callout_block_summary(self, notion_adapter, sample_content, mock_notion_client):
-        await notion_adapter.create_content_page(sample_content)
-        call_kwargs = mock_notion_client.pages.create.call_args.kwargs
         children = call_kwargs["children"]
         assert children[0]["type"] == "callout"
         callout_text = children[0]["callout"]["rich_text"][0]["text"]["content"]
         assert callout_text == sample_content.summary
 
+        parent = call_kwargs["parent"]
+        assert parent["type"] == "data_source_id"
+        assert parent["data_source_id"] == "test-ds-id"
+
     @pytest.mark.asyncio
     async def test_truncates_summary_to_2000(self, notion_adapter, mock_notion_client):
-        long_content = ContentRecord(
-            id=2,
-            title="Long Content",
-            category=Category.NETWORK,
-            difficulty=Difficulty.INTERMEDIATE,
-            summary="x" * 3000,
-            content="x" * 3000,
-            tags=[],
-            author="TestUser",
-            status=ContentStatus.DRAFT,
+        long_content = make_content(
+            id=2, title="Long Content", summary=_LONG_3000, content=_LONG_3000, tags=[]
         )
         await notion_adapter.create_content_page(long_content)
         call_kwargs = mock_notion_client.pages.create.call_args.kwargs
@@ -165,16 +198,6 @@ class TestCreateContentPage:
         callout_text = children[0]["callout"]["rich_text"][0]["text"]["content"]
         assert len(callout_text) == 2000
 
-    @pytest.mark.asyncio
-    async def test_uses_data_source_parent(
-        self, notion_adapter, sample_content, mock_notion_client
-    ):
-        await notion_adapter.create_content_page(sample_content)
-        call_kwargs = mock_notion_client.pages.create.call_args.kwargs
-        parent = call_kwargs["parent"]
-        assert parent["type"] == "data_source_id"
-        assert parent["data_source_id"] == "test-ds-id"
-
 
 class TestCreateReportPage:
     @pytest.mark.asyncio
@@ -192,51 +215,49 @@ class TestCreateReportPage:
         assert "10500" in content_str  # avg_duration_ms
 
 
+@pytest.fixture(scope="module")
+def bare_adapter():
+    """NotionAdapter without a client, for the pure conversion helpers"""
+    return object.__new__(NotionAdapter)
+
+
 class TestMarkdownToBlocks:
-    def test_headers(self, notion_adapter):
-        md = "# H1\n## H2\n### H3"
-        blocks = notion_adapter._markdown_to_blocks(md)
-        assert len(blocks) == 3
-        assert blocks[0]["type"] == "heading_1"
-        assert blocks[1]["type"] == "heading_2"
-        assert blocks[2]["type"] == "heading_3"
-
-    def test_lists_and_quotes(self, notion_adapter):
-        md = "- bullet\n1. numbered\n> quote"
-        blocks = notion_adapter._markdown_to_blocks(md)
-        assert len(blocks) == 3
-        assert blocks[0]["type"] == "bulleted_list_item"
-        assert blocks[1]["type"] == "numbered_list_item"
-        assert blocks[2]["type"] == "quote"
-
-    def test_code_block(self, notion_adapter):
-        md = "```python\nprint('hello')\n```"
-        blocks = notion_adapter._markdown_to_blocks(md)
-        assert len(blocks) == 1
-        assert blocks[0]["type"] == "code"
+    @pytest.mark.parametrize(
+        "md, expected_types",
+        [
+            ("# H1\n## H2\n### H3", ["heading_1", "heading_2", "heading_3"]),
+            (
+                "- bullet\n1. numbered\n> quote",
+                ["bulleted_list_item", "numbered_list_item", "quote"],
+            ),
+            ("```python\nprint('hello')\n```", ["code"]),
+            (
+                "# Title\n\nParagraph text\n\n- item1\n- item2\n\n---\n\n> quote",
+                [
+                    "heading_1",
+                    "paragraph",
+                    "bulleted_list_item",
+                    "bulleted_list_item",
+                    "divider",
+                    "quote",
+                ],
+            ),
+            ("", []),
+            ("10. Tenth item\n25. Twenty-fifth item", ["numbered_list_item", "numbered_list_item"]),
+        ],
+        ids=["headers", "lists-and-quotes", "code-block", "mixed", "empty", "multidigit-numbered"],
+    )
+    def test_block_types(self, bare_adapter, md, expected_types):
+        blocks = bare_adapter._markdown_to_blocks(md)
+        assert [b["type"] for b in blocks] == expected_types
+
+    def test_code_block_content(self, bare_adapter):
+        blocks = bare_adapter._markdown_to_blocks("```python\nprint('hello')\n```")
         assert blocks[0]["code"]["language"] == "python"
         assert "print('hello')" in blocks[0]["code"]["rich_text"][0]["text"]["content"]
 
-    def test_mixed_content(self, notion_adapter):
-        md = "# Title\n\nParagraph text\n\n- item1\n- item2\n\n---\n\n> quote"
-        blocks = notion_adapter._markdown_to_blocks(md)
-        types = [b["type"] for b in blocks]
-        assert types[0] == "heading_1"
-        assert types[1] == "paragraph"
-        assert types[2] == "bulleted_list_item"
-        assert types[3] == "bulleted_list_item"
-        assert types[4] == "divider"
-        assert types[5] == "quote"
-
-    def test_empty_markdown(self, notion_adapter):
-        blocks = notion_adapter._markdown_to_blocks("")
-        assert blocks == []
-
-    def test_multidigit_numbered_list(self, notion_adapter):
-        blocks = notion_adapter._markdown_to_blocks("10. Tenth item\n25. Twenty-fifth item")
-        assert len(blocks) == 2
-        assert blocks[0]["type"] == "numbered_list_item"
-        assert blocks[1]["type"] == "numbered_list_item"
+    def test_multidigit_numbered_list_text(self, bare_adapter):
+        blocks = bare_adapter._markdown_to_blocks("10. Tenth item\n25. Twenty-fifth item")
         text_0 = blocks[0]["numbered_list_item"]["rich_text"][0]["text"]["content"]
         text_1 = blocks[1]["numbered_list_item"]["rich_text"][0]["text"]["content"]
         assert text_0 == "Tenth item"
@@ -244,16 +265,20 @@ class TestMarkdownToBlocks:
 
 
 class TestMapLanguage:
-    def test_known_languages(self, notion_adapter):
-        assert notion_adapter._map_language("python") == "python"
-        assert notion_adapter._map_language("py") == "python"
-        assert notion_adapter._map_language("js") == "javascript"
-        assert notion_adapter._map_language("cpp") == "c++"
-        assert notion_adapter._map_language("typescript") == "typescript"
-
-    def test_unknown_language_returns_plain_text(self, notion_adapter):
-        assert notion_adapter._map_language("unknown_lang") == "plain text"
-        assert notion_adapter._map_language("xyz") == "plain text"
+    @pytest.mark.parametrize(
+        "lang, expected",
+        [
+            ("python", "python"),
+            ("py", "python"),
+            ("js", "javascript"),
+            ("cpp", "c++"),
+            ("typescript", "typescript"),
+            ("unknown_lang", "plain text"),
+            ("xyz", "plain text"),
+        ],
+    )
+    def test_map_language(self, bare_adapter, lang, expected):
+        assert bare_adapter._map_language(lang) == expected
 
 
 class TestNotionHealthCheck:
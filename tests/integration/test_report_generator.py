@@ -2,73 +2,105 @@
 Integration tests for src/reports/generator.py
 """
 
+from types import SimpleNamespace
+
 import pytest
 
+from config.topics import CATEGORIES
 from src.domain.enums import ReportType
 from src.domain.models import ReportData
 from src.reports.generator import ReportGenerator
+from tests.helpers import CallRecorder, StubRepository
+
+_REPORT_PAGE = ("report-page-id", "https://notion.so/report")
 
 
 @pytest.fixture
-def report_gen(mock_repository, mock_slack_adapter, mock_notion_adapter):
-    return ReportGenerator(
-        repository=mock_repository,
-        slack_adapter=mock_slack_adapter,
-        notion_adapter=mock_notion_adapter,
-    )
+def mock_notion_adapter():
+    """Recording NotionAdapter double; overrides the conftest mock"""
+    return CallRecorder(create_report_page=_REPORT_PAGE)
+
+
+@pytest.fixture
+def mock_slack_adapter():
+    """Recording SlackAdapter double; overrides the conftest mock"""
+    return CallRecorder()
+
+
+@pytest.fixture(scope="module")
+def _report_template():
+    """One ReportGenerator per module; collaborators are swapped in per test"""
+    return ReportGenerator(repository=None, slack_adapter=None, notion_adapter=None)
+
+
+@pytest.fixture
+def report_gen(_report_template, mock_repository, mock_slack_adapter, mock_notion_adapter):
+    gen = _report_template
+    gen.repository = mock_repository
+    gen.slack = mock_slack_adapter
+    gen.notion = mock_notion_adapter
+    return gen
+
+
+@pytest.fixture(scope="module")
+async def weekly_run(_settings_once):
+    """Generate the weekly report once; probe tests only read the outcome"""
+    notion = CallRecorder(create_report_page=_REPORT_PAGE)
+    slack = CallRecorder()
+    gen = ReportGenerator(repository=StubRepository(), slack_adapter=slack, notion_adapter=notion)
+    report = await gen.generate_weekly_report()
+    return SimpleNamespace(report=report, notion=notion, slack=slack)
+
+
+class TestInit:
+    def test_stores_collaborators(self, mock_repository, mock_slack_adapter):
+        gen = ReportGenerator(repository=mock_repository, slack_adapter=mock_slack_adapter)
+        assert gen.repository is mock_repository
+        assert gen.slack is mock_slack_adapter
+        assert gen.notion is None
 
 
 class TestWeeklyReport:
-    @pytest.mark.asyncio
-    async def test_generates_report_data(self, report_gen):
-        report = await report_gen.generate_weekly_report()
-        assert isinstance(report, ReportData)
-        assert report.report_type == ReportType.WEEKLY.value
+    def test_generates_report_data(self, weekly_run):
+        assert isinstance(weekly_run.report, ReportData)
+        assert weekly_run.report.report_type == ReportType.WEEKLY.value
 
-    @pytest.mark.asyncio
-    async def test_creates_notion_page(self, report_gen, mock_notion_adapter):
-        await report_gen.generate_weekly_report()
-        mock_notion_adapter.create_report_page.assert_awaited_once()
+    def test_creates_notion_page(self, weekly_run):
+        weekly_run.notion.assert_awaited_once("create_report_page")
 
-    @pytest.mark.asyncio
-    async def test_sends_slack_notification(self, report_gen, mock_slack_adapter):
-        await report_gen.generate_weekly_report()
-        mock_slack_adapter.send_report_notification.assert_awaited_once()
+    def test_sends_slack_notification(self, weekly_run):
+        weekly_run.slack.assert_awaited_once("send_report_notification")
 
     @pytest.mark.asyncio
     async def test_handles_notion_failure(
         self, report_gen, mock_notion_adapter, mock_slack_adapter
     ):
-        mock_notion_adapter.create_report_page.side_effect = Exception("Notion error")
+        mock_notion_adapter.responses["create_report_page"] = Exception("Notion error")
         report = await report_gen.generate_weekly_report()
         # Should still send Slack notification without Notion URL
         assert isinstance(report, ReportData)
-        mock_slack_adapter.send_report_notification.assert_awaited_once()
+        mock_slack_adapter.assert_awaited_once("send_report_notification")
         # Check it was called without notion_url
-        call_kwargs = mock_slack_adapter.send_report_notification.call_args
+        [(args, kwargs)] = mock_slack_adapter.awaited("send_report_notification")
         # Second call (in except block) should have no notion_url
-        assert call_kwargs.kwargs.get("notion_url") is None or len(call_kwargs.args) == 1
+        assert kwargs.get("notion_url") is None or len(args) == 1
 
-    @pytest.mark.asyncio
-    async def test_success_rate_calculation(self, report_gen):
-        report = await report_gen.generate_weekly_report()
-        assert report.success_count == 9
-        assert report.failed_count == 1
+    def test_success_rate_calculation(self, weekly_run):
+        assert weekly_run.report.success_count == 9
+        assert weekly_run.report.failed_count == 1
 
-    @pytest.mark.asyncio
-    async def test_duration_statistics(self, report_gen):
-        report = await report_gen.generate_weekly_report()
+    def test_duration_statistics(self, weekly_run):
+        report = weekly_run.report
         assert report.avg_duration_ms == 10500
         assert report.min_duration_ms == 8000
         assert report.max_duration_ms == 15000
 
-    @pytest.mark.asyncio
-    async def test_calculates_uncovered_categories(self, report_gen):
-        report = await report_gen.generate_weekly_report()
+    def test_calculates_uncovered_categories(self, weekly_run):
+        uncovered = weekly_run.report.uncovered_categories
         # mock returns {"network": 3, "os": 2}, so 10 categories uncovered
-        assert len(report.uncovered_categories) == 10
-        assert "network" not in report.uncovered_categories
-        assert "os" not in report.uncovered_categories
+        assert len(uncovered) == 10
+        assert "network" not in uncovered
+        assert "os" not in uncovered
 
 
 class TestMonthlyReport:
@@ -81,40 +113,16 @@ class TestMonthlyReport:
     @pytest.mark.asyncio
     async def test_creates_notion_page(self, report_gen, mock_notion_adapter):
         await report_gen.generate_monthly_report()
-        mock_notion_adapter.create_report_page.assert_awaited_once()
-
-
-class TestReportData:
-    @pytest.mark.asyncio
-    async def test_handles_no_executions(
-        self, mock_repository, mock_slack_adapter, mock_notion_adapter
-    ):
-        mock_repository.get_content_count.return_value = 0
-        mock_repository.get_execution_stats.return_value = {}
-        mock_repository.get_category_distribution.return_value = {}
-
-        gen = ReportGenerator(
-            repository=mock_repository,
-            slack_adapter=mock_slack_adapter,
-            notion_adapter=mock_notion_adapter,
-        )
-        report = await gen.generate_weekly_report()
-        assert report.total_count == 0
-        assert report.success_count == 0
-        assert report.failed_count == 0
-        assert report.avg_duration_ms is None
+        mock_notion_adapter.assert_awaited_once("create_report_page")
 
 
 class TestReportsWithoutNotion:
     """Tests for report generation when Notion is not configured"""
 
     @pytest.fixture
-    def report_gen_no_notion(self, mock_repository, mock_slack_adapter):
-        return ReportGenerator(
-            repository=mock_repository,
-            slack_adapter=mock_slack_adapter,
-            notion_adapter=None,
-        )
+    def report_gen_no_notion(self, report_gen):
+        report_gen.notion = None
+        return report_gen
 
     @pytest.mark.asyncio
     async def test_weekly_report_slack_only(self, report_gen_no_notion, mock_slack_adapter):
@@ -122,7 +130,7 @@ class TestReportsWithoutNotion:
         report = await report_gen_no_notion.generate_weekly_report()
         assert isinstance(report, ReportData)
         assert report.report_type == ReportType.WEEKLY.value
-        mock_slack_adapter.send_report_notification.assert_awaited_once()
+        mock_slack_adapter.assert_awaited_once("send_report_notification")
 
     @pytest.mark.asyncio
     async def test_monthly_report_slack_only(self, report_gen_no_notion, mock_slack_adapter):
@@ -130,129 +138,95 @@ class TestReportsWithoutNotion:
         report = await report_gen_no_notion.generate_monthly_report()
         assert isinstance(report, ReportData)
         assert report.report_type == ReportType.MONTHLY.value
-        mock_slack_adapter.send_report_notification.assert_awaited_once()
+        mock_slack_adapter.assert_awaited_once("send_report_notification")
 
     @pytest.mark.asyncio
     async def test_weekly_no_notion_url(self, report_gen_no_notion, mock_slack_adapter):
         """Slack notification should be sent without notion_url when Notion is None"""
         await report_gen_no_notion.generate_weekly_report()
-        call_args = mock_slack_adapter.send_report_notification.call_args
+        [(_, kwargs)] = mock_slack_adapter.awaited("send_report_notification")
         # Should be called with report only, no notion_url
-        assert call_args.kwargs.get("notion_url") is None
+        assert kwargs.get("notion_url") is None
+
+
+def _stats(success, failed=None):
+    """Execution stats as returned by ContentRepository.get_execution_stats"""
+    return {"success": success, "failed": failed or {"count": 0, "total_attempts": 0}}
+
+
+_NO_DURATIONS = {"avg_duration_ms": None, "min_duration_ms": None, "max_duration_ms": None}
+
+# (content count, execution stats, category distribution, expected report fields)
+_REPO_SCENARIOS = {
+    "no-executions": (
+        0,
+        {},
+        {},
+        {
+            "total_count": 0,
+            "success_count": 0,
+            "failed_count": 0,
+            "avg_duration_ms": None,
+            "uncovered_categories": set(CATEGORIES),
+        },
+    ),
+    "empty-execution-stats": (
+        0,
+        _stats(
+            {"count": 0, "total_attempts": 0, **_NO_DURATIONS},
+            {"count": 0, "total_attempts": 0, **_NO_DURATIONS},
+        ),
+        {},
+        {"total_count": 0, "success_count": 0, "failed_count": 0, "avg_duration_ms": None},
+    ),
+    "none-duration-fields": (
+        5,
+        _stats({"count": 5, "total_attempts": 5, **_NO_DURATIONS}),
+        {"network": 5},
+        _NO_DURATIONS,
+    ),
+    "zero-retry-count": (
+        5,
+        _stats(
+            {
+                "count": 5,
+                "total_attempts": 5,
+                "avg_duration_ms": 10000,
+                "min_duration_ms": 8000,
+                "max_duration_ms": 12000,
+            }
+        ),
+        {"network": 5},
+        {"retry_count": 0},
+    ),
+}
 
 
 class TestEdgeCases:
     @pytest.mark.asyncio
-    async def test_empty_execution_stats(
-        self, mock_repository, mock_slack_adapter, mock_notion_adapter
+    @pytest.mark.parametrize(
+        "content_count, stats, distribution, expected",
+        list(_REPO_SCENARIOS.values()),
+        ids=list(_REPO_SCENARIOS),
+    )
+    async def test_repo_scenarios(
+        self, report_gen, mock_repository, content_count, stats, distribution, expected
     ):
-        mock_repository.get_content_count.return_value = 0
-        mock_repository.get_execution_stats.return_value = {
-            "success": {
-                "count": 0,
-                "total_attempts": 0,
-                "avg_duration_ms": None,
-                "min_duration_ms": None,
-                "max_duration_ms": None,
-            },
-            "failed": {
-                "count": 0,
-                "total_attempts": 0,
-                "avg_duration_ms": None,
-                "min_duration_ms": None,
-                "max_duration_ms": None,
-            },
-        }
-        mock_repository.get_category_distribution.return_value = {}
-
-        gen = ReportGenerator(
-            repository=mock_repository,
-            slack_adapter=mock_slack_adapter,
-            notion_adapter=mock_notion_adapter,
-        )
-        report = await gen.generate_weekly_report()
-        assert report.total_count == 0
-        assert report.success_count == 0
-        assert report.failed_count == 0
-        assert report.avg_duration_ms is None
+        mock_repository.get_content_count_return = content_count
+        mock_repository.get_execution_stats_return = stats
+        mock_repository.get_category_distribution_return = distribution
 
-    @pytest.mark.asyncio
-    async def test_none_duration_fields(
-        self, mock_repository, mock_slack_adapter, mock_notion_adapter
-    ):
-        mock_repository.get_content_count.return_value = 5
-        mock_repository.get_execution_stats.return_value = {
-            "success": {
-                "count": 5,
-                "total_attempts": 5,
-                "avg_duration_ms": None,
-                "min_duration_ms": None,
-                "max_duration_ms": None,
-            },
-            "failed": {"count": 0, "total_attempts": 0},
-        }
-        mock_repository.get_category_distribution.return_value = {"network": 5}
-
-        gen = ReportGenerator(
-            repository=mock_repository,
-            slack_adapter=mock_slack_adapter,
-            notion_adapter=mock_notion_adapter,
-        )
-        report = await gen.generate_weekly_report()
-        assert report.avg_duration_ms is None
-        assert report.min_duration_ms is None
-        assert report.max_duration_ms is None
-
-    @pytest.mark.asyncio
-    async def test_all_categories_uncovered(
-        self, mock_repository, mock_slack_adapter, mock_notion_adapter
-    ):
-        mock_repository.get_content_count.return_value = 0
-        mock_repository.get_execution_stats.return_value = {}
-        mock_repository.get_category_distribution.return_value = {}
-
-        gen = ReportGenerator(
-            repository=mock_repository,
-            slack_adapter=mock_slack_adapter,
-            notion_adapter=mock_notion_adapter,
-        )
-        report = await gen.generate_weekly_report()
-        assert len(report.uncovered_categories) == 12
+        report = await report_gen.generate_weekly_report()
+        for field, value in expected.items():
+            actual = getattr(report, field)
+            assert (set(actual) if isinstance(value, set) else actual) == value, field
 
     @pytest.mark.asyncio
     async def test_monthly_report_notion_failure(
-        self, mock_repository, mock_slack_adapter, mock_notion_adapter
+        self, report_gen, mock_slack_adapter, mock_notion_adapter
     ):
-        mock_notion_adapter.create_report_page.side_effect = Exception("Notion error")
-        gen = ReportGenerator(
-            repository=mock_repository,
-            slack_adapter=mock_slack_adapter,
-            notion_adapter=mock_notion_adapter,
-        )
-        report = await gen.generate_monthly_report()
+        mock_notion_adapter.responses["create_report_page"] = Exception("Notion error")
+        report = await report_gen.generate_monthly_report()
         assert isinstance(report, ReportData)
         # Slack notification should still be sent (fallback without notion_url)
-        mock_slack_adapter.send_report_notification.assert_awaited()
-
-    @pytest.mark.asyncio
-    async def test_zero_retry_count(self, mock_repository, mock_slack_adapter, mock_notion_adapter):
-        mock_repository.get_content_count.return_value = 5
-        mock_repository.get_execution_stats.return_value = {
-            "success": {
-                "count": 5,
-                "total_attempts": 5,
-                "avg_duration_ms": 10000,
-                "min_duration_ms": 8000,
-                "max_duration_ms": 12000,
-            },
-            "failed": {"count": 0, "total_attempts": 0},
-        }
-        mock_repository.get_category_distribution.return_value = {"network": 5}
-
-        gen = ReportGenerator(
-            repository=mock_repository,
-            slack_adapter=mock_slack_adapter,
-            notion_adapter=mock_notion_adapter,
-        )
-        report = await gen.generate_weekly_report()
-        assert report.retry_count == 0
+        assert mock_slack_adapter.awaited("send_report_notification")
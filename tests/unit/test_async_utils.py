@@ -5,15 +5,12 @@ Unit tests for src/utils/async_utils.py
 import asyncio
 from unittest.mock import Mock, patch
 
-import pytest
-
 from src.utils.async_utils import create_background_task
 
 
 class TestCreateBackgroundTask:
     """Tests for create_background_task function"""
 
-    @pytest.mark.asyncio
     async def test_creates_task(self):
         """Should create an asyncio.Task"""
 
@@ -27,7 +24,6 @@ class TestCreateBackgroundTask:
         result = await task
         assert result == "done"
 
-    @pytest.mark.asyncio
     async def test_task_executes_coroutine(self):
         """Task should execute the coroutine"""
         result_holder = []
@@ -41,7 +37,6 @@ class TestCreateBackgroundTask:
 
         assert result_holder == ["executed"]
 
-    @pytest.mark.asyncio
     async def test_logs_error_on_exception(self):
         """Should log error when task raises exception"""
 
@@ -54,37 +49,36 @@ class TestCreateBackgroundTask:
                 context="Test context",
             )
 
-            # Wait for task to complete (and fail)
-            await asyncio.sleep(0.1)
+            # Wait for task to complete (and fail); done callbacks run first
+            await asyncio.wait({task})
 
             # Verify error was logged
             mock_logger.error.assert_called_once()
             call_args = mock_logger.error.call_args
             assert "Test context" in call_args[0][0]
 
-    @pytest.mark.asyncio
     async def test_calls_on_error_callback(self):
         """Should call on_error callback when task fails"""
-        error_callback = Mock()
+        called = asyncio.Event()
+        error_callback = Mock(side_effect=lambda e: called.set())
 
         async def failing_coro():
             raise ValueError("Test error")
 
-        task = create_background_task(
+        create_background_task(
             failing_coro(),
             context="Test",
             on_error=error_callback,
         )
 
-        # Wait for task to complete
-        await asyncio.sleep(0.1)
+        # Wait for the callback itself
+        await called.wait()
 
         # Verify callback was called with exception
         error_callback.assert_called_once()
         call_arg = error_callback.call_args[0][0]
         assert isinstance(call_arg, ValueError)
 
-    @pytest.mark.asyncio
     async def test_handles_cancelled_task(self):
         """Should handle cancelled tasks gracefully"""
 
@@ -102,7 +96,6 @@ class TestCreateBackgroundTask:
         except asyncio.CancelledError:
             pass  # Expected
 
-    @pytest.mark.asyncio
     async def test_context_parameter_optional(self):
         """Context parameter should be optional"""
 
@@ -114,7 +107,6 @@ class TestCreateBackgroundTask:
         result = await task
         assert result == "done"
 
-    @pytest.mark.asyncio
     async def test_on_error_parameter_optional(self):
         """on_error parameter should be optional"""
 
@@ -125,9 +117,8 @@ class TestCreateBackgroundTask:
         task = create_background_task(failing_coro(), context="Test")
 
         # Wait for task to complete
-        await asyncio.sleep(0.1)
+        await asyncio.wait({task})
 
-    @pytest.mark.asyncio
     async def test_preserves_return_value(self):
         """Should preserve coroutine return value"""
 
@@ -9,6 +9,8 @@ import pytest
 from src.utils.datetime_utils import (
     format_datetime,
     format_time,
+    get_next_run_time,
+    get_next_run_time_from_time,
     humanize_timedelta,
     parse_time,
 )
@@ -17,70 +19,90 @@ from src.utils.datetime_utils import (
 class TestParseTime:
     """Tests for parse_time function"""
 
-    def test_parse_valid_time(self):
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("07:00", time(7, 0)),
+            ("19:30", time(19, 30)),
+            ("00:00", time(0, 0)),
+            ("23:59", time(23, 59)),
+        ],
+    )
+    def test_parse_valid_time(self, value, expected):
         """Test parsing valid time strings"""
-        assert parse_time("07:00") == time(7, 0)
-        assert parse_time("19:30") == time(19, 30)
-        assert parse_time("00:00") == time(0, 0)
-        assert parse_time("23:59") == time(23, 59)
+        assert parse_time(value) == expected
 
-    def test_parse_invalid_time(self):
+    @pytest.mark.parametrize("value", ["25:00", "12:60", "invalid", "12"])
+    def test_parse_invalid_time(self, value):
         """Test parsing invalid time strings"""
         with pytest.raises(ValueError):
-            parse_time("25:00")
-
-        with pytest.raises(ValueError):
-            parse_time("12:60")
-
-        with pytest.raises(ValueError):
-            parse_time("invalid")
-
-        with pytest.raises(ValueError):
-            parse_time("12")
+            parse_time(value)
 
 
 class TestFormatTime:
     """Tests for format_time function"""
 
-    def test_format_time(self):
+    @pytest.mark.parametrize(
+        "value, expected",
+        [(time(7, 0), "07:00"), (time(19, 30), "19:30"), (time(0, 0), "00:00")],
+    )
+    def test_format_time(self, value, expected):
         """Test formatting time objects"""
-        assert format_time(time(7, 0)) == "07:00"
-        assert format_time(time(19, 30)) == "19:30"
-        assert format_time(time(0, 0)) == "00:00"
+        assert format_time(value) == expected
 
 
 class TestFormatDatetime:
     """Tests for format_datetime function"""
 
-    def test_format_datetime_with_time(self):
-        """Test formatting datetime with time"""
-        dt = datetime(2024, 1, 15, 14, 30)
-        assert format_datetime(dt) == "2024-01-15 14:30"
+    @pytest.mark.parametrize(
+        "dt, kwargs, expected",
+        [
+            (datetime(2024, 1, 15, 14, 30), {}, "2024-01-15 14:30"),
+            (datetime(2024, 1, 15, 14, 30), {"include_time": False}, "2024-01-15"),
+            # Single-digit fields are zero-padded
+            (datetime(987, 3, 5, 4, 7), {}, "0987-03-05 04:07"),
+        ],
+        ids=["with-time", "without-time", "zero-pads"],
+    )
+    def test_format_datetime(self, dt, kwargs, expected):
+        """Test formatting datetimes"""
+        assert format_datetime(dt, **kwargs) == expected
 
-    def test_format_datetime_without_time(self):
-        """Test formatting datetime without time"""
-        dt = datetime(2024, 1, 15, 14, 30)
-        assert format_datetime(dt, include_time=False) == "2024-01-15"
 
+class TestGetNextRunTime:
+    """Tests for get_next_run_time function"""
 
-class TestHumanizeTimedelta:
-    """Tests for humanize_timedelta function"""
+    def test_later_today(self):
+        """Test schedule later on the reference day"""
+        ref = datetime(2024, 1, 15, 6, 0)
+        assert get_next_run_time("07:00", ref) == datetime(2024, 1, 15, 7, 0)
+
+    def test_passed_rolls_to_tomorrow(self):
+        """Test schedule already passed rolls over to next day"""
+        ref = datetime(2024, 1, 15, 7, 0)
+        assert get_next_run_time("07:00", ref) == datetime(2024, 1, 16, 7, 0)
 
-    def test_seconds(self):
-        """Test humanizing seconds"""
-        assert humanize_timedelta(timedelta(seconds=30)) == "30초"
+    def test_from_parsed_time(self):
+        """Test pre-parsed variant matches string variant"""
+        ref = datetime(2024, 1, 15, 12, 0)
+        assert get_next_run_time_from_time(time(19, 30), ref) == get_next_run_time("19:30", ref)
 
-    def test_minutes(self):
-        """Test humanizing minutes"""
-        assert humanize_timedelta(timedelta(minutes=5)) == "5분"
-        assert humanize_timedelta(timedelta(minutes=45)) == "45분"
 
-    def test_hours(self):
-        """Test humanizing hours"""
-        assert humanize_timedelta(timedelta(hours=2)) == "2시간"
-        assert humanize_timedelta(timedelta(hours=2, minutes=30)) == "2시간 30분"
+class TestHumanizeTimedelta:
+    """Tests for humanize_timedelta function"""
 
-    def test_days(self):
-        """Test humanizing days"""
-        assert humanize_timedelta(timedelta(days=3)) == "3일"
-        assert humanize_timedelta(timedelta(days=1, hours=5)) == "1일 5시간"
+    @pytest.mark.parametrize(
+        "delta, expected",
+        [
+            (timedelta(seconds=30), "30초"),
+            (timedelta(minutes=5), "5분"),
+            (timedelta(minutes=45), "45분"),
+            (timedelta(hours=2), "2시간"),
+            (timedelta(hours=2, minutes=30), "2시간 30분"),
+            (timedelta(days=3), "3일"),
+            (timedelta(days=1, hours=5), "1일 5시간"),
+        ],
+    )
+    def test_humanize(self, delta, expected):
+        """Test humanizing seconds, minutes, hours and days"""
+        assert humanize_timedelta(delta) == expected
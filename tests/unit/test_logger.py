@@ -0,0 +1,167 @@
+"""
+Unit tests for src/utils/logger.py
+"""
+
+import logging
+import os
+import time
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+import structlog
+
+from src.utils import logger as logger_module
+from src.utils.logger import cleanup_old_logs, setup_logging, today_yyyymmdd
+
+
+@pytest.fixture
+def isolated_logging(monkeypatch):
+    """Isolate the root logger, structlog config and the setup guard for one test"""
+    root = logging.getLogger()
+    saved_handlers = root.handlers[:]
+    saved_level = root.level
+    saved_structlog = structlog.get_config()
+
+    monkeypatch.setattr(logger_module, "_CONFIGURED", False)
+    monkeypatch.setattr(logger_module, "settings", SimpleNamespace(log_level="INFO"))
+    yield root
+
+    for handler in root.handlers:
+        handler.close()
+    root.handlers = saved_handlers
+    root.setLevel(saved_level)
+    structlog.configure(**saved_structlog)
+
+
+def _first_setup(root, **overrides):
+    """First setup_logging call of a fresh process (no root handlers yet)"""
+    # pytest attaches its capture handlers to the root logger for the test call
+    root.handlers.clear()
+    setup_logging(**overrides)
+
+
+def _file_handlers(root):
+    return [h for h in root.handlers if isinstance(h, logging.FileHandler)]
+
+
+class TestSetupLogging:
+    """Tests for setup_logging function"""
+
+    def test_repeat_call_without_overrides_is_noop(self, isolated_logging, tmp_path):
+        """Test that a repeat call without overrides keeps the installed handlers"""
+        _first_setup(isolated_logging, log_dir=str(tmp_path))
+        handlers = isolated_logging.handlers[:]
+
+        setup_logging()
+
+        assert isolated_logging.handlers == handlers
+        assert len(_file_handlers(isolated_logging)) == 1
+
+    def test_repeat_call_with_overrides_does_not_duplicate_handlers(
+        self, isolated_logging, tmp_path
+    ):
+        """Test that a repeat call with overrides replaces handlers instead of adding more"""
+        _first_setup(isolated_logging, log_dir=str(tmp_path))
+        setup_logging(log_dir=str(tmp_path))
+
+        assert len(isolated_logging.handlers) == 2
+        assert len(_file_handlers(isolated_logging)) == 1
+
+    def test_reconfigure_replaces_handlers_and_level(self, isolated_logging, tmp_path):
+        """Test that reconfiguring applies the new level and log directory"""
+        first_dir, second_dir = tmp_path / "first", tmp_path / "second"
+        _first_setup(isolated_logging, log_level="INFO", log_dir=str(first_dir))
+        (old_file_handler,) = _file_handlers(isolated_logging)
+
+        setup_logging(log_level="DEBUG", log_dir=str(second_dir))
+
+        (new_file_handler,) = _file_handlers(isolated_logging)
+        assert isolated_logging.level == logging.DEBUG
+        assert new_file_handler.baseFilename.startswith(str(second_dir))
+        # The replaced handler's file is closed rather than leaked
+        assert old_file_handler.stream is None
+
+
+class _FakeDate:
+    """Stand-in for datetime.date whose today() the test controls"""
+
+    current = date(2024, 1, 1)
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+class TestTodayYyyymmdd:
+    """Tests for today_yyyymmdd function"""
+
+    @pytest.fixture(autouse=True)
+    def fake_date(self, monkeypatch):
+        """Start each test on 2024-01-01 with an empty date cache"""
+        monkeypatch.setattr(logger_module, "date", _FakeDate)
+        monkeypatch.setattr(logger_module, "_TODAY_CACHE", None)
+        monkeypatch.setattr(_FakeDate, "current", date(2024, 1, 1))
+        return _FakeDate
+
+    def test_same_day_reuses_cached_string(self):
+        """Test that calls on the same day reuse the cached string"""
+        first = today_yyyymmdd()
+        cached = logger_module._TODAY_CACHE
+
+        assert first == "20240101"
+        assert today_yyyymmdd() is first
+        assert logger_module._TODAY_CACHE is cached
+
+    def test_recomputes_after_midnight(self, fake_date):
+        """Test that the string is recomputed once the date changes"""
+        assert today_yyyymmdd() == "20240101"
+
+        fake_date.current = date(2024, 1, 2)
+
+        assert today_yyyymmdd() == "20240102"
+
+    def test_recomputes_across_month_and_year(self, fake_date):
+        """Test recomputation across a month and year boundary"""
+        fake_date.current = date(2024, 12, 31)
+        assert today_yyyymmdd() == "20241231"
+
+        fake_date.current = date(2025, 1, 1)
+
+        assert today_yyyymmdd() == "20250101"
+
+
+class TestCleanupOldLogs:
+    """Tests for cleanup_old_logs function"""
+
+    @pytest.fixture
+    def log_dir(self, monkeypatch, tmp_path):
+        """Point the default log directory at tmp_path"""
+        monkeypatch.setattr(logger_module, "_LOG_DIR", tmp_path)
+        return tmp_path
+
+    @staticmethod
+    def _touch(path, age_seconds):
+        """Create path with an mtime age_seconds in the past"""
+        path.write_text("")
+        mtime = time.time() - age_seconds
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_deletes_only_logs_older_than_cutoff(self, log_dir):
+        """Test that only daily logs older than the retention cutoff are deleted"""
+        days = 7
+        cutoff = days * 86400
+        old = self._touch(log_dir / "daily_bot_20240101.log", cutoff + 60)
+        recent = self._touch(log_dir / "daily_bot_20240108.log", cutoff - 60)
+        unrelated = self._touch(log_dir / "other.log", cutoff + 60)
+
+        assert cleanup_old_logs(retention_days=days) == 1
+        assert not old.exists()
+        assert recent.exists()
+        assert unrelated.exists()
+
+    def test_missing_log_dir_returns_zero(self, monkeypatch, tmp_path):
+        """Test that a missing log directory deletes nothing"""
+        monkeypatch.setattr(logger_module, "_LOG_DIR", tmp_path / "missing")
+        assert cleanup_old_logs(retention_days=7) == 0
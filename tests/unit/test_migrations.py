@@ -1,6 +1,7 @@
 """Tests for database migration system"""
 
 import asyncio
+import fnmatch
 import tempfile
 from pathlib import Path
 
@@ -9,27 +10,82 @@ import pytest
 
 from src.storage.migrations.runner import MigrationRunner
 
+_TEST_TABLE_SQL = "CREATE TABLE IF NOT EXISTS test_table (id INTEGER PRIMARY KEY);"
+_FIRST_TABLE_SQL = "CREATE TABLE IF NOT EXISTS first_table (id INTEGER PRIMARY KEY);"
+_SECOND_TABLE_SQL = "CREATE TABLE IF NOT EXISTS second_table (id INTEGER PRIMARY KEY);"
+
+
+class _MemPath:
+    """Just enough of pathlib.Path for MigrationRunner, backed by a dict"""
+
+    def __init__(self, files: dict[str, bytes], name: str):
+        self._files = files
+        self.name = name
+        self.stem = name.rsplit(".", 1)[0]
+
+    def __lt__(self, other: "_MemPath") -> bool:
+        return self.name < other.name
+
+    def write_bytes(self, data: bytes) -> None:
+        self._files[self.name] = data
+
+    def read_text(self, encoding: str = "utf-8") -> str:
+        return self._files[self.name].decode(encoding)
+
+
+class _MemMigrationsDir:
+    """In-memory stand-in for a migrations directory"""
+
+    def __init__(self):
+        self._files: dict[str, bytes] = {}
+
+    def __truediv__(self, name: str) -> _MemPath:
+        return _MemPath(self._files, name)
+
+    def glob(self, pattern: str):
+        return (_MemPath(self._files, n) for n in fnmatch.filter(self._files, pattern))
+
+
+def _write_migrations(mig_dir, files: dict[str, str]) -> None:
+    """Write migration files as raw bytes, skipping write_text's codec lookup"""
+    for name, sql in files.items():
+        (mig_dir / name).write_bytes(sql.encode("utf-8"))
+
 
 class TestMigrationRunner:
     """Test suite for MigrationRunner"""
 
-    @pytest.fixture
-    async def db_connection(self, tmp_path):
-        """Create a temporary database connection"""
-        db_path = tmp_path / "test_migrations.db"
-        conn = await aiosqlite.connect(str(db_path))
+    @pytest.fixture(scope="class")
+    async def _shared_connection(self):
+        """One in-memory database connection for the whole class"""
+        conn = await aiosqlite.connect(":memory:")
         conn.row_factory = aiosqlite.Row
         yield conn
         await conn.close()
 
     @pytest.fixture
-    def migrations_dir(self, tmp_path):
-        """Create a temporary migrations directory"""
+    async def db_connection(self, _shared_connection):
+        """Shared connection with every table dropped, so each test starts empty"""
+        conn = _shared_connection
+        cursor = await conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = [row[0] for row in await cursor.fetchall()]
+        if tables:
+            await conn.executescript("".join(f"DROP TABLE {t};" for t in tables))
+            await conn.commit()
+        return conn
+
+    @pytest.fixture
+    def migrations_dir(self):
+        """In-memory migrations directory"""
+        return _MemMigrationsDir()
+
+    @pytest.fixture
+    def disk_migrations_dir(self, tmp_path):
+        """Create a temporary migrations directory on disk"""
         mig_dir = tmp_path / "migrations"
         mig_dir.mkdir()
         return mig_dir
 
-    @pytest.mark.asyncio
     async def test_initialize_creates_tracking_table(self, db_connection, migrations_dir):
         """Initialize should create _schema_versions table"""
         runner = MigrationRunner(db_connection, migrations_dir)
@@ -41,7 +97,6 @@ class TestMigrationRunner:
         row = await cursor.fetchone()
         assert row is not None
 
-    @pytest.mark.asyncio
     async def test_get_current_version_empty_db(self, db_connection, migrations_dir):
         """Empty DB should return version 0"""
         runner = MigrationRunner(db_connection, migrations_dir)
@@ -50,12 +105,13 @@ class TestMigrationRunner:
         version = await runner.get_current_version()
         assert version == 0
 
-    @pytest.mark.asyncio
     async def test_get_current_version_after_apply(self, db_connection, migrations_dir):
         """After applying migration, version should update"""
-        (migrations_dir / "001_test.sql").write_text(
-            "CREATE TABLE IF NOT EXISTS test_table (id INTEGER PRIMARY KEY);",
-            encoding="utf-8",
+        _write_migrations(
+            migrations_dir,
+            {
+                "001_test.sql": _TEST_TABLE_SQL,
+            },
         )
         runner = MigrationRunner(db_connection, migrations_dir)
         await runner.initialize()
@@ -64,16 +120,14 @@ class TestMigrationRunner:
         version = await runner.get_current_version()
         assert version == 1
 
-    @pytest.mark.asyncio
     async def test_run_pending_applies_all(self, db_connection, migrations_dir):
         """All pending migrations should be applied"""
-        (migrations_dir / "001_first.sql").write_text(
-            "CREATE TABLE IF NOT EXISTS first_table (id INTEGER PRIMARY KEY);",
-            encoding="utf-8",
-        )
-        (migrations_dir / "002_second.sql").write_text(
-            "CREATE TABLE IF NOT EXISTS second_table (id INTEGER PRIMARY KEY);",
-            encoding="utf-8",
+        _write_migrations(
+            migrations_dir,
+            {
+                "001_first.sql": _FIRST_TABLE_SQL,
+                "002_second.sql": _SECOND_TABLE_SQL,
+            },
         )
         runner = MigrationRunner(db_connection, migrations_dir)
         await runner.initialize()
@@ -81,12 +135,13 @@ class TestMigrationRunner:
         applied = await runner.run_pending()
         assert applied == [1, 2]
 
-    @pytest.mark.asyncio
     async def test_run_pending_skips_applied(self, db_connection, migrations_dir):
         """Already applied migrations should be skipped"""
-        (migrations_dir / "001_first.sql").write_text(
-            "CREATE TABLE IF NOT EXISTS first_table (id INTEGER PRIMARY KEY);",
-            encoding="utf-8",
+        _write_migrations(
+            migrations_dir,
+            {
+                "001_first.sql": _FIRST_TABLE_SQL,
+            },
         )
         runner = MigrationRunner(db_connection, migrations_dir)
         await runner.initialize()
@@ -96,21 +151,27 @@ class TestMigrationRunner:
         assert applied1 == [1]
 
         # Add second migration
-        (migrations_dir / "002_second.sql").write_text(
-            "CREATE TABLE IF NOT EXISTS second_table (id INTEGER PRIMARY KEY);",
-            encoding="utf-8",
+        _write_migrations(
+            migrations_dir,
+            {
+                "002_second.sql": _SECOND_TABLE_SQL,
+            },
         )
 
         # Should only apply the new one
         applied2 = await runner.run_pending()
         assert applied2 == [2]
 
-    @pytest.mark.asyncio
     async def test_discover_migrations_sorted(self, db_connection, migrations_dir):
         """Migrations should be sorted by version number"""
-        (migrations_dir / "003_third.sql").write_text("SELECT 1;", encoding="utf-8")
-        (migrations_dir / "001_first.sql").write_text("SELECT 1;", encoding="utf-8")
-        (migrations_dir / "002_second.sql").write_text("SELECT 1;", encoding="utf-8")
+        _write_migrations(
+            migrations_dir,
+            {
+                "003_third.sql": "SELECT 1;",
+                "001_first.sql": "SELECT 1;",
+                "002_second.sql": "SELECT 1;",
+            },
+        )
 
         runner = MigrationRunner(db_connection, migrations_dir)
         migrations = runner._discover_migrations()
@@ -118,14 +179,15 @@ class TestMigrationRunner:
         versions = [m[0] for m in migrations]
         assert versions == [1, 2, 3]
 
-    @pytest.mark.asyncio
-    async def test_idempotent_on_existing_db(self, db_connection, migrations_dir):
+    async def test_idempotent_on_existing_db(self, db_connection, disk_migrations_dir):
         """Running migrations on existing DB should be safe"""
-        (migrations_dir / "001_initial.sql").write_text(
-            "CREATE TABLE IF NOT EXISTS test_table (id INTEGER PRIMARY KEY);",
-            encoding="utf-8",
+        _write_migrations(
+            disk_migrations_dir,
+            {
+                "001_initial.sql": _TEST_TABLE_SQL,
+            },
         )
-        runner = MigrationRunner(db_connection, migrations_dir)
+        runner = MigrationRunner(db_connection, disk_migrations_dir)
         await runner.initialize()
 
         # Run twice
@@ -135,16 +197,16 @@ class TestMigrationRunner:
         assert applied1 == [1]
         assert applied2 == []  # Nothing to apply
 
-    @pytest.mark.asyncio
     async def test_multiple_migrations_sequential(self, db_connection, migrations_dir):
         """Multiple migrations should apply in sequence"""
-        (migrations_dir / "001_create.sql").write_text(
-            "CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY, name TEXT);",
-            encoding="utf-8",
-        )
-        (migrations_dir / "002_add_index.sql").write_text(
-            "CREATE INDEX IF NOT EXISTS idx_users_name ON users(name);",
-            encoding="utf-8",
+        _write_migrations(
+            migrations_dir,
+            {
+                "001_create.sql": (
+                    "CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY, name TEXT);"
+                ),
+                "002_add_index.sql": "CREATE INDEX IF NOT EXISTS idx_users_name ON users(name);",
+            },
         )
 
         runner = MigrationRunner(db_connection, migrations_dir)
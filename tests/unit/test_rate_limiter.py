@@ -1,91 +1,148 @@
 """Tests for AsyncRateLimiter"""
 
 import asyncio
-import time
+import functools
 
 import pytest
 
 from src.utils.rate_limiter import AsyncRateLimiter
 
 
+def fail_after(seconds: float):
+    """Fail the test instead of hanging if the limiter deadlocks"""
+
+    def decorator(test):
+        @functools.wraps(test)
+        async def wrapper(*args, **kwargs):
+            async with asyncio.timeout(seconds):
+                return await test(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class FakeClock:
+    """Virtual monotonic clock; sleeping advances it instead of waiting"""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock():
+    """Virtual clock shared by the limiter and the test"""
+    return FakeClock()
+
+
+@pytest.fixture
+def make_limiter(clock):
+    """Build limiters driven by the FakeClock instead of wall time"""
+
+    def make(**kwargs) -> AsyncRateLimiter:
+        return AsyncRateLimiter(clock=clock.monotonic, sleep=clock.sleep, **kwargs)
+
+    return make
+
+
 class TestAsyncRateLimiter:
     """Test suite for AsyncRateLimiter"""
 
-    @pytest.mark.asyncio
-    async def test_allows_burst_requests(self):
+    @fail_after(2.0)
+    async def test_allows_burst_requests(self, clock, make_limiter):
         """Burst requests should pass immediately"""
-        limiter = AsyncRateLimiter(rate=10, period=1.0, burst=3)
-        start = time.monotonic()
+        limiter = make_limiter(rate=10, period=1.0, burst=3)
+        start = clock.now
         for _ in range(3):
             await limiter.acquire()
-        elapsed = time.monotonic() - start
-        assert elapsed < 0.1
+        assert clock.now == start
 
-    @pytest.mark.asyncio
-    async def test_blocks_after_burst(self):
+    @fail_after(2.0)
+    async def test_blocks_after_burst(self, clock, make_limiter):
         """Requests after burst should be delayed"""
-        limiter = AsyncRateLimiter(rate=10, period=1.0, burst=1)
+        limiter = make_limiter(rate=10, period=1.0, burst=1)
         await limiter.acquire()  # Use the one burst token
-        start = time.monotonic()
+        start = clock.now
         await limiter.acquire()  # Should wait
-        elapsed = time.monotonic() - start
-        assert elapsed >= 0.05  # Should have some delay
+        assert clock.now - start == pytest.approx(0.1)
 
-    @pytest.mark.asyncio
-    async def test_refills_tokens_over_time(self):
+    @fail_after(2.0)
+    async def test_refills_tokens_over_time(self, clock, make_limiter):
         """Tokens should refill after waiting"""
-        limiter = AsyncRateLimiter(rate=100, period=1.0, burst=1)
+        limiter = make_limiter(rate=100, period=1.0, burst=1)
         await limiter.acquire()  # Use token
-        await asyncio.sleep(0.05)  # Wait for refill
-        start = time.monotonic()
-        await limiter.acquire()  # Should be quick now
-        elapsed = time.monotonic() - start
-        assert elapsed < 0.05
-
-    @pytest.mark.asyncio
-    async def test_context_manager(self):
+        clock.advance(0.05)  # Wait for refill
+        start = clock.now
+        await limiter.acquire()  # Should be immediate now
+        assert clock.now == start
+
+    @fail_after(2.0)
+    async def test_context_manager(self, clock, make_limiter):
         """Should work as async context manager"""
-        limiter = AsyncRateLimiter(rate=10, period=1.0, burst=1)
+        limiter = make_limiter(rate=10, period=1.0, burst=1)
         async with limiter:
             pass  # Should not raise
 
-    @pytest.mark.asyncio
-    async def test_concurrent_access(self):
-        """Multiple concurrent acquisitions should be safe"""
-        limiter = AsyncRateLimiter(rate=100, period=1.0, burst=5)
+    @fail_after(2.0)
+    async def test_concurrent_access(self, clock, make_limiter):
+        """Contending waiters should be released one token interval apart"""
+        limiter = make_limiter(rate=1000, period=1.0, burst=1)
+        start = clock.now
+        done: list[float] = []
 
         async def acquire_token():
             await limiter.acquire()
+            done.append(clock.now - start)
+
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(10):
+                tg.create_task(acquire_token())
 
-        tasks = [acquire_token() for _ in range(5)]
-        await asyncio.gather(*tasks)
+        # One burst token, then one token per 1ms for the other nine waiters
+        assert done == pytest.approx([i / 1000 for i in range(10)])
 
-    @pytest.mark.asyncio
-    async def test_respects_rate(self):
+    @fail_after(2.0)
+    async def test_respects_rate(self, clock, make_limiter):
         """Rate parameter should control throughput"""
-        limiter = AsyncRateLimiter(rate=50, period=1.0, burst=1)
+        limiter = make_limiter(rate=50, period=1.0, burst=1)
         await limiter.acquire()
-        start = time.monotonic()
+        start = clock.now
         await limiter.acquire()
-        elapsed = time.monotonic() - start
         # At 50/sec, each token takes 0.02s
-        assert elapsed >= 0.01
+        assert clock.now - start == pytest.approx(0.02)
 
-    @pytest.mark.asyncio
-    async def test_respects_period(self):
+    @fail_after(2.0)
+    async def test_respects_period(self, clock, make_limiter):
         """Period parameter should be respected"""
-        limiter = AsyncRateLimiter(rate=1, period=0.1, burst=1)
+        limiter = make_limiter(rate=1, period=0.1, burst=1)
         await limiter.acquire()
-        start = time.monotonic()
+        start = clock.now
         await limiter.acquire()
-        elapsed = time.monotonic() - start
-        assert elapsed >= 0.05
+        assert clock.now - start == pytest.approx(0.1)
 
-    @pytest.mark.asyncio
-    async def test_zero_burst_waits(self):
+    @fail_after(2.0)
+    async def test_zero_burst_waits(self, clock, make_limiter):
         """With burst=0, first acquire should wait"""
-        limiter = AsyncRateLimiter(rate=100, period=1.0, burst=0)
-        start = time.monotonic()
+        limiter = make_limiter(rate=100, period=1.0, burst=0)
+        start = clock.now
+        await limiter.acquire()
+        assert clock.now - start == pytest.approx(0.01)
+
+    @fail_after(2.0)
+    async def test_single_producer_blocks_after_burst(self, clock, make_limiter):
+        """Unlocked single-producer mode should still throttle"""
+        limiter = make_limiter(rate=10, period=1.0, burst=1, single_producer=True)
+        await limiter.acquire()
+        start = clock.now
         await limiter.acquire()
-        elapsed = time.monotonic() - start
-        assert elapsed >= 0.005
+        assert clock.now - start == pytest.approx(0.1)
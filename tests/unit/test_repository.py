@@ -2,8 +2,6 @@
 Unit tests for src/storage/sqlite_repository.py
 """
 
-import os
-import tempfile
 from datetime import datetime
 
 import pytest
@@ -22,52 +20,61 @@ from src.domain.models import (
 )
 from src.storage.sqlite_repository import SQLiteRepository
 
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
 
-@pytest.fixture
-async def repository():
-    """Create a temporary SQLite repository for testing"""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
 
-    repo = SQLiteRepository(db_path)
+@pytest.fixture(scope="module")
+async def _module_repository():
+    """One in-memory repository per module; the schema is migrated once"""
+    repo = SQLiteRepository(":memory:")
     await repo.initialize()
 
     yield repo
 
     await repo.close()
-    os.unlink(db_path)
+
+
+@pytest.fixture
+async def repository(_module_repository):
+    """Shared repository with every data table emptied before the test"""
+    conn = await _module_repository._get_connection()
+    cursor = await conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' "
+        "AND name NOT LIKE 'sqlite_%' AND name != '_schema_versions'"
+    )
+    tables = [row["name"] for row in await cursor.fetchall()]
+    await conn.executescript("".join(f"DELETE FROM {t};" for t in tables))
+    await conn.commit()
+    return _module_repository
 
 
 class TestSQLiteRepositoryInitialization:
     """Tests for repository initialization"""
 
-    @pytest.mark.asyncio
-    async def test_initialize_creates_tables(self):
+    async def test_initialize_creates_tables(self, tmp_path):
         """Should create all required tables"""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
-
-        repo = SQLiteRepository(db_path)
+        repo = SQLiteRepository(str(tmp_path / "test.db"))
         await repo.initialize()
 
-        # Verify tables exist by querying them
+        # Verify tables exist with one filtered sqlite_master query
+        expected = ("content_records", "schedules", "execution_logs", "topic_requests")
         conn = await repo._get_connection()
-        cursor = await conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = {row["name"] for row in await cursor.fetchall()}
+        cursor = await conn.execute(
+            "SELECT group_concat(name) FROM sqlite_master "
+            "WHERE type='table' AND name IN (?, ?, ?, ?)",
+            expected,
+        )
+        (names,) = await cursor.fetchone()
 
-        assert "content_records" in tables
-        assert "schedules" in tables
-        assert "execution_logs" in tables
-        assert "topic_requests" in tables
+        assert names is not None
+        assert set(names.split(",")) == set(expected)
 
         await repo.close()
-        os.unlink(db_path)
 
 
 class TestContentRecordOperations:
     """Tests for content record CRUD operations"""
 
-    @pytest.mark.asyncio
     async def test_save_content(self, repository):
         """Should save content record and return with ID"""
         content = ContentRecord(
@@ -85,7 +92,6 @@ class TestContentRecordOperations:
         assert saved.id is not None
         assert saved.title == "Test Content"
 
-    @pytest.mark.asyncio
     async def test_get_content(self, repository):
         """Should retrieve content by ID"""
         content = ContentRecord(
@@ -103,7 +109,6 @@ class TestContentRecordOperations:
         assert retrieved.id == saved.id
         assert retrieved.title == "Get Test"
 
-    @pytest.mark.asyncio
     async def test_get_content_by_title(self, repository):
         """Should retrieve content by title"""
         content = ContentRecord(
@@ -120,7 +125,6 @@ class TestContentRecordOperations:
         assert retrieved is not None
         assert retrieved.title == "Unique Title"
 
-    @pytest.mark.asyncio
     async def test_list_contents(self, repository):
         """Should list all contents"""
         for i in range(3):
@@ -141,7 +145,6 @@ class TestContentRecordOperations:
 class TestExecutionLogOperations:
     """Tests for execution log CRUD operations"""
 
-    @pytest.mark.asyncio
     async def test_save_execution_log(self, repository):
         """Should save execution log"""
         log = ExecutionLog(
@@ -153,7 +156,6 @@ class TestExecutionLogOperations:
 
         assert saved.id is not None
 
-    @pytest.mark.asyncio
     async def test_save_execution_log_with_duration(self, repository):
         """Should save execution log with duration_ms"""
         log = ExecutionLog(
@@ -167,7 +169,6 @@ class TestExecutionLogOperations:
 
         assert retrieved.duration_ms == 1500
 
-    @pytest.mark.asyncio
     async def test_update_execution_log_duration(self, repository):
         """Should update execution log with duration_ms"""
         log = ExecutionLog(
@@ -179,7 +180,7 @@ class TestExecutionLogOperations:
         # Update with duration
         saved.status = ExecutionStatus.SUCCESS
         saved.duration_ms = 2500
-        saved.completed_at = datetime.now()
+        saved.completed_at = _NOW
         await repository.update_execution_log(saved)
 
         retrieved = await repository.get_execution_log(saved.id)
@@ -187,18 +188,19 @@ class TestExecutionLogOperations:
         assert retrieved.status == ExecutionStatus.SUCCESS
         assert retrieved.duration_ms == 2500
 
-    @pytest.mark.asyncio
     async def test_get_execution_stats_includes_duration(self, repository):
         """Should include duration stats in execution statistics"""
-        # Create logs with different durations
-        for duration in [1000, 2000, 3000]:
-            log = ExecutionLog(
-                schedule_id=1,
-                status=ExecutionStatus.SUCCESS,
-                duration_ms=duration,
-                completed_at=datetime.now(),
-            )
-            await repository.save_execution_log(log)
+        # Seed logs with different durations in one statement; saving is covered above
+        conn = await repository._get_connection()
+        await conn.executemany(
+            "INSERT INTO execution_logs (schedule_id, status, duration_ms, started_at) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (1, ExecutionStatus.SUCCESS.value, duration, _NOW.isoformat())
+                for duration in (1000, 2000, 3000)
+            ],
+        )
+        await conn.commit()
 
         stats = await repository.get_execution_stats()
         success_stats = stats.get(ExecutionStatus.SUCCESS.value, {})
@@ -211,7 +213,6 @@ class TestExecutionLogOperations:
 class TestScheduleOperations:
     """Tests for schedule CRUD operations"""
 
-    @pytest.mark.asyncio
     async def test_save_schedule(self, repository):
         """Should save schedule"""
         schedule = Schedule(
@@ -224,7 +225,6 @@ class TestScheduleOperations:
         assert saved.id is not None
         assert saved.time == "07:00"
 
-    @pytest.mark.asyncio
     async def test_get_schedule_by_time(self, repository):
         """Should retrieve schedule by time"""
         schedule = Schedule(time="09:00")
@@ -235,7 +235,6 @@ class TestScheduleOperations:
         assert retrieved is not None
         assert retrieved.time == "09:00"
 
-    @pytest.mark.asyncio
     async def test_list_schedules_active_only(self, repository):
         """Should list only active schedules by default"""
         active = Schedule(time="07:00", status=ScheduleStatus.ACTIVE)
@@ -253,7 +252,6 @@ class TestScheduleOperations:
 class TestTopicRequestOperations:
     """Tests for topic request CRUD operations"""
 
-    @pytest.mark.asyncio
     async def test_save_topic_request(self, repository):
         """Should save topic request"""
         request = TopicRequest(
@@ -266,7 +264,6 @@ class TestTopicRequestOperations:
         assert saved.id is not None
         assert saved.topic == "TCP/IP"
 
-    @pytest.mark.asyncio
     async def test_get_pending_requests(self, repository):
         """Should return only pending requests"""
         pending = TopicRequest(topic="Topic 1", requested_by="user1")
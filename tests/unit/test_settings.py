@@ -5,78 +5,57 @@ Unit tests for config/settings.py
 import pytest
 from pydantic import ValidationError
 
+from config.settings import Settings, _LazySettings, get_settings
 
-class TestSettingsValidators:
-    """Tests for Settings field validators"""
 
-    def test_valid_time_format(self, mock_settings):
-        """Valid time format should pass"""
-        # Clear lru_cache
-        from config.settings import Settings, get_settings
+@pytest.fixture(autouse=True)
+def _clear_settings_cache():
+    """Each test starts and ends with an empty get_settings cache"""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
 
-        get_settings.cache_clear()
 
-        settings = Settings(_env_file=".env.example")
-        assert settings.default_schedule_time == "07:00"
+@pytest.fixture(scope="module")
+def baseline_settings(test_env):
+    """Settings built once from the test env for tests that only read it"""
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in test_env.items():
+            mp.setenv(key, value)
+        return Settings(_env_file=".env.example")
 
-    def test_invalid_time_format_raises(self, mock_settings, monkeypatch):
-        """Invalid time format should raise ValidationError"""
-        from config.settings import Settings, get_settings
 
-        get_settings.cache_clear()
-
-        monkeypatch.setenv("DEFAULT_SCHEDULE_TIME", "25:00")
-
-        with pytest.raises(ValidationError):
-            Settings(_env_file=".env.example")
-
-    def test_invalid_time_format_no_colon(self, mock_settings, monkeypatch):
-        """Time without colon should raise ValidationError"""
-        from config.settings import Settings, get_settings
-
-        get_settings.cache_clear()
-
-        monkeypatch.setenv("DEFAULT_SCHEDULE_TIME", "0700")
+class TestSettingsValidators:
+    """Tests for Settings field validators"""
 
-        with pytest.raises(ValidationError):
-            Settings(_env_file=".env.example")
+    def test_valid_time_format(self, baseline_settings):
+        """Valid time format should pass"""
+        settings = baseline_settings
+        assert settings.default_schedule_time == "07:00"
 
-    def test_valid_weekday(self, mock_settings):
+    def test_valid_weekday(self, baseline_settings):
         """Valid weekday (0-6) should pass"""
-        from config.settings import Settings, get_settings
-
-        get_settings.cache_clear()
-
-        settings = Settings(_env_file=".env.example")
+        settings = baseline_settings
         assert 0 <= settings.weekly_report_day <= 6
 
-    def test_invalid_weekday_raises(self, mock_settings, monkeypatch):
-        """Invalid weekday should raise ValidationError"""
-        from config.settings import Settings, get_settings
-
-        get_settings.cache_clear()
-
-        monkeypatch.setenv("WEEKLY_REPORT_DAY", "7")
-
-        with pytest.raises(ValidationError):
-            Settings(_env_file=".env.example")
-
-    def test_valid_monthday(self, mock_settings):
+    def test_valid_monthday(self, baseline_settings):
         """Valid month day (1-28) should pass"""
-        from config.settings import Settings, get_settings
-
-        get_settings.cache_clear()
-
-        settings = Settings(_env_file=".env.example")
+        settings = baseline_settings
         assert 1 <= settings.monthly_report_day <= 28
 
-    def test_invalid_monthday_raises(self, mock_settings, monkeypatch):
-        """Invalid month day should raise ValidationError"""
-        from config.settings import Settings, get_settings
-
-        get_settings.cache_clear()
-
-        monkeypatch.setenv("MONTHLY_REPORT_DAY", "29")
+    @pytest.mark.parametrize(
+        "env_var, bad_value",
+        [
+            ("DEFAULT_SCHEDULE_TIME", "25:00"),
+            ("DEFAULT_SCHEDULE_TIME", "0700"),
+            ("WEEKLY_REPORT_DAY", "7"),
+            ("MONTHLY_REPORT_DAY", "29"),
+        ],
+        ids=["time-out-of-range", "time-no-colon", "weekday", "monthday"],
+    )
+    def test_invalid_value_raises(self, mock_settings, monkeypatch, env_var, bad_value):
+        """Out-of-range or malformed values should raise ValidationError"""
+        monkeypatch.setenv(env_var, bad_value)
 
         with pytest.raises(ValidationError):
             Settings(_env_file=".env.example")
@@ -87,39 +66,23 @@ class TestSettingsProperties:
 
     def test_report_channel_uses_report_channel_id(self, mock_settings, monkeypatch):
         """report_channel should use slack_report_channel_id if set"""
-        from config.settings import Settings, get_settings
-
-        get_settings.cache_clear()
-
         monkeypatch.setenv("SLACK_REPORT_CHANNEL_ID", "C_REPORT_123")
 
         settings = Settings(_env_file=".env.example")
         assert settings.report_channel == "C_REPORT_123"
 
-    def test_report_channel_fallback_to_main(self, mock_settings):
+    def test_report_channel_fallback_to_main(self, baseline_settings):
         """report_channel should fallback to main channel if report not set"""
-        from config.settings import Settings, get_settings
-
-        get_settings.cache_clear()
-
-        settings = Settings(_env_file=".env.example")
+        settings = baseline_settings
         assert settings.report_channel == settings.slack_channel_id
 
-    def test_notion_enabled_true(self, mock_settings):
+    def test_notion_enabled_true(self, baseline_settings):
         """notion_enabled should be True when both keys are set"""
-        from config.settings import Settings, get_settings
-
-        get_settings.cache_clear()
-
-        settings = Settings(_env_file=".env.example")
+        settings = baseline_settings
         assert settings.notion_enabled is True
 
     def test_notion_enabled_false_no_keys(self, mock_settings, monkeypatch):
         """notion_enabled should be False when Notion keys are None"""
-        from config.settings import Settings, get_settings
-
-        get_settings.cache_clear()
-
         monkeypatch.delenv("NOTION_API_KEY", raising=False)
         monkeypatch.delenv("NOTION_DATABASE_ID", raising=False)
 
@@ -128,36 +91,19 @@ class TestSettingsProperties:
         assert settings.notion_database_id is None
         assert settings.notion_enabled is False
 
-    def test_notion_enabled_false_empty_strings(self, mock_settings, monkeypatch):
-        """notion_enabled should be False when Notion keys are empty strings"""
-        from config.settings import Settings, get_settings
-
-        get_settings.cache_clear()
-
-        monkeypatch.setenv("NOTION_API_KEY", "")
-        monkeypatch.setenv("NOTION_DATABASE_ID", "")
-
-        settings = Settings(_env_file=".env.example")
-        assert settings.notion_enabled is False
-
-    def test_notion_enabled_false_partial_no_db_id(self, mock_settings, monkeypatch):
-        """notion_enabled should be False when only api_key is set"""
-        from config.settings import Settings, get_settings
-
-        get_settings.cache_clear()
-
-        monkeypatch.setenv("NOTION_DATABASE_ID", "")
-
-        settings = Settings(_env_file=".env.example")
-        assert settings.notion_enabled is False
-
-    def test_notion_enabled_false_partial_no_api_key(self, mock_settings, monkeypatch):
-        """notion_enabled should be False when only database_id is set"""
-        from config.settings import Settings, get_settings
-
-        get_settings.cache_clear()
-
-        monkeypatch.setenv("NOTION_API_KEY", "")
+    @pytest.mark.parametrize(
+        "empty_vars",
+        [
+            ("NOTION_API_KEY", "NOTION_DATABASE_ID"),
+            ("NOTION_DATABASE_ID",),
+            ("NOTION_API_KEY",),
+        ],
+        ids=["empty-strings", "partial-no-db-id", "partial-no-api-key"],
+    )
+    def test_notion_enabled_false_when_empty(self, mock_settings, monkeypatch, empty_vars):
+        """notion_enabled should be False unless both Notion keys are non-empty"""
+        for var in empty_vars:
+            monkeypatch.setenv(var, "")
 
         settings = Settings(_env_file=".env.example")
         assert settings.notion_enabled is False
@@ -170,7 +116,6 @@ class TestLazySettings:
         """_LazySettings should not validate until first access"""
         # This test verifies that importing settings doesn't immediately fail
         # even if env vars are missing
-        from config.settings import _LazySettings
 
         # Create new lazy settings without validation
         lazy = _LazySettings()
@@ -178,27 +123,20 @@ class TestLazySettings:
 
     def test_lazy_settings_getattr(self, mock_settings):
         """_LazySettings should proxy attribute access"""
-        from config.settings import _LazySettings, get_settings
-
-        get_settings.cache_clear()
-
         lazy = _LazySettings()
         # Access should work after env is set
         assert lazy.timezone == "Asia/Seoul"
 
-    def test_lazy_settings_setattr(self, mock_settings):
+    def test_lazy_settings_setattr(self, baseline_settings):
         """_LazySettings should proxy attribute setting"""
-        from config.settings import _LazySettings, get_settings
-
-        get_settings.cache_clear()
-
         lazy = _LazySettings()
-        # Force initialization
-        _ = lazy.timezone
+        # Inject an already-validated copy instead of initializing through get_settings()
+        lazy._instance = baseline_settings.model_copy()
 
         # Setting attribute should work
         lazy.log_level = "DEBUG"
         assert lazy.log_level == "DEBUG"
+        assert lazy._instance.log_level == "DEBUG"
 
 
 class TestGetSettings:
@@ -206,19 +144,11 @@ class TestGetSettings:
 
     def test_returns_settings_instance(self, mock_settings):
         """get_settings should return Settings instance"""
-        from config.settings import Settings, get_settings
-
-        get_settings.cache_clear()
-
         settings = get_settings()
         assert isinstance(settings, Settings)
 
     def test_caching_returns_same_instance(self, mock_settings):
         """get_settings should return cached instance"""
-        from config.settings import get_settings
-
-        get_settings.cache_clear()
-
         settings1 = get_settings()
         settings2 = get_settings()
         assert settings1 is settings2
@@ -227,14 +157,9 @@ class TestGetSettings:
 class TestSettingsDefaults:
     """Tests for Settings default values"""
 
-    def test_default_values(self, mock_settings):
+    def test_default_values(self, baseline_settings):
         """Verify default values are set correctly"""
-        from config.settings import Settings, get_settings
-
-        get_settings.cache_clear()
-
-        settings = Settings(_env_file=".env.example")
-
+        settings = baseline_settings
         assert settings.default_schedule_time == "07:00"
         assert settings.timezone == "Asia/Seoul"
         assert settings.language == "ko"
@@ -2,9 +2,14 @@
 Unit tests for config/topics.py
 """
 
+import pytest
+
 from config.topics import (
     CATEGORIES,
+    CATEGORY_KEYS,
+    TOPIC_KEYS,
     TOPICS,
+    TopicEntry,
     get_all_topics,
     get_category_name,
     get_topics_by_category,
@@ -13,6 +18,18 @@ from config.topics import (
 )
 
 
+@pytest.fixture(scope="module")
+def all_topics():
+    """get_all_topics() resolved once for the module"""
+    return get_all_topics()
+
+
+@pytest.fixture(scope="module")
+def total_count():
+    """get_total_topic_count() resolved once for the module"""
+    return get_total_topic_count()
+
+
 class TestCategories:
     """Tests for CATEGORIES dictionary"""
 
@@ -32,7 +49,7 @@ class TestTopics:
 
     def test_topics_matches_categories(self):
         """TOPICS keys should match CATEGORIES keys"""
-        assert set(TOPICS.keys()) == set(CATEGORIES.keys())
+        assert TOPIC_KEYS == CATEGORY_KEYS
 
     def test_each_category_has_topics(self):
         """Each category should have at least one topic"""
@@ -43,16 +60,18 @@ class TestTopics:
 class TestGetAllTopics:
     """Tests for get_all_topics function"""
 
-    def test_returns_list_of_tuples(self):
-        """Should return list of (category, topic) tuples"""
-        all_topics = get_all_topics()
-        assert isinstance(all_topics, list)
-        assert all(isinstance(t, tuple) and len(t) == 2 for t in all_topics)
+    def test_returns_tuple_of_topic_entries(self, all_topics):
+        """Should return a tuple of TopicEntry (category, topic) pairs"""
+        assert isinstance(all_topics, tuple)
+        assert all_topics[0] == TopicEntry(category="network", topic=TOPICS["network"][0])
 
-    def test_count_matches_total(self):
+    def test_count_matches_total(self, all_topics, total_count):
         """Number of topics should match get_total_topic_count"""
-        all_topics = get_all_topics()
-        assert len(all_topics) == get_total_topic_count()
+        assert len(all_topics) == total_count
+
+    def test_result_is_shared_and_immutable(self):
+        """Repeated calls should return the same precomputed tuple"""
+        assert get_all_topics() is get_all_topics()
 
 
 class TestGetTopicsByCategory:
@@ -69,6 +88,11 @@ class TestGetTopicsByCategory:
         topics = get_topics_by_category("invalid_category")
         assert topics == []
 
+    def test_empty_result_is_not_shared(self):
+        """Mutating one miss result should not leak into the next call"""
+        get_topics_by_category("invalid_category").append("leaked")
+        assert get_topics_by_category("invalid_category") == []
+
 
 class TestGetCategoryName:
     """Tests for get_category_name function"""
@@ -92,57 +116,44 @@ class TestGetCategoryName:
 class TestGetTotalTopicCount:
     """Tests for get_total_topic_count function"""
 
-    def test_returns_positive_count(self):
+    def test_returns_positive_count(self, total_count):
         """Should return a positive integer"""
-        count = get_total_topic_count()
-        assert isinstance(count, int)
-        assert count > 0
+        assert isinstance(total_count, int)
+        assert total_count > 0
 
-    def test_matches_sum_of_all_categories(self):
+    def test_matches_sum_of_all_categories(self, total_count):
         """Should match sum of topics in all categories"""
         expected = sum(len(topics) for topics in TOPICS.values())
-        assert get_total_topic_count() == expected
+        assert total_count == expected
 
 
 class TestInferCategoryFromTopic:
     """Tests for infer_category_from_topic function"""
 
-    def test_exact_match(self):
-        """Should find category for exact topic match"""
-        result = infer_category_from_topic("TCP vs UDP 비교")
-        assert result == "network"
-
-    def test_case_insensitive_match(self):
-        """Should match regardless of case"""
-        result = infer_category_from_topic("tcp vs udp 비교")
-        assert result == "network"
-
-    def test_partial_match(self):
-        """Should find category with partial match"""
-        result = infer_category_from_topic("TCP")
-        assert result == "network"
-
-    def test_returns_none_for_unknown(self):
-        """Should return None for unknown topics"""
-        result = infer_category_from_topic("completely unknown topic xyz123")
-        assert result is None
-
-    def test_strips_whitespace(self):
-        """Should strip leading/trailing whitespace"""
-        result = infer_category_from_topic("  TCP vs UDP 비교  ")
-        assert result == "network"
-
-    def test_algorithm_category(self):
-        """Should correctly identify algorithm topics"""
-        result = infer_category_from_topic("이진 탐색")
-        assert result == "algorithm"
-
-    def test_database_category(self):
-        """Should correctly identify database topics"""
-        result = infer_category_from_topic("트랜잭션 ACID 속성")
-        assert result == "database"
-
-    def test_design_pattern_category(self):
-        """Should correctly identify design pattern topics"""
-        result = infer_category_from_topic("싱글톤 패턴")
-        assert result == "design_pattern"
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            pytest.param("TCP vs UDP 비교", "network", id="exact"),
+            pytest.param("tcp vs udp 비교", "network", id="case-insensitive"),
+            pytest.param("TCP", "network", id="partial"),
+            pytest.param("  TCP vs UDP 비교  ", "network", id="strips-whitespace"),
+            pytest.param("오늘은 TCP vs UDP 비교 해주세요", "network", id="topic-inside-query"),
+            pytest.param("이진 탐색", "algorithm", id="algorithm"),
+            pytest.param("트랜잭션 ACID 속성", "database", id="database"),
+            pytest.param("싱글톤 패턴", "design_pattern", id="design-pattern"),
+            # "팩토리 메서드" (oop) is a substring of this design_pattern topic
+            pytest.param("팩토리 메서드 패턴", "design_pattern", id="exact-beats-earlier-partial"),
+            # Listed under both database and architecture
+            pytest.param("CQRS 패턴", "database", id="duplicate-uses-first-category"),
+            pytest.param("completely unknown topic xyz123", None, id="unknown"),
+        ],
+    )
+    def test_infer(self, query, expected):
+        assert infer_category_from_topic(query) == expected
+
+    def test_repeat_query_is_cached(self):
+        """Repeated queries should be served from the cache"""
+        infer_category_from_topic("gRPC 프로토콜")
+        hits = infer_category_from_topic.cache_info().hits
+        infer_category_from_topic("gRPC 프로토콜")
+        assert infer_category_from_topic.cache_info().hits == hits + 1